@@ -7,10 +7,12 @@ This file is automatically loaded by pytest for all test sessions.
 
 import os
 import sys
+import socket
 import asyncio
 import logging
 import tempfile
 import shutil
+import functools
 from pathlib import Path
 from typing import Dict, Any, Generator
 import pytest
@@ -33,6 +35,20 @@ TEST_CONFIG = {
     "cleanup_on_exit": True
 }
 
+# Endpoint used to detect whether the runner has network access
+NETWORK_PROBE_ADDRESS = ("1.1.1.1", 53)
+NETWORK_PROBE_TIMEOUT = 0.5
+
+
+@functools.lru_cache(maxsize=None)
+def network_is_available() -> bool:
+    """Probe network access once per test session."""
+    try:
+        socket.create_connection(NETWORK_PROBE_ADDRESS, NETWORK_PROBE_TIMEOUT).close()
+        return True
+    except OSError:
+        return False
+
 
 def pytest_configure(config):
     """Configure pytest with custom settings."""
@@ -58,6 +74,13 @@ def pytest_configure(config):
     # Configure asyncio for testing
     if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        # Prefer uvloop's libuv-based event loop when it is installed
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     
     # Register custom markers
     for marker_name, marker_description in {
@@ -169,6 +192,10 @@ def pytest_runtest_setup(item):
     # Skip non-smoke tests if --smoke-only is specified
     if item.config.getoption('--smoke-only') and "smoke" not in item.keywords:
         pytest.skip("Only running smoke tests (--smoke-only)")
+    
+    # Skip network tests up front instead of waiting on navigation timeouts
+    if "network" in item.keywords and not network_is_available():
+        pytest.skip("Network access unavailable")
 
 
 def pytest_runtest_teardown(item, nextitem):
@@ -271,6 +298,12 @@ def test_session_setup():
             os.environ[key] = value
 
 
+@pytest.fixture(scope="session")
+def network_available() -> bool:
+    """Report whether the test runner can reach the internet."""
+    return network_is_available()
+
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Provide test data directory."""
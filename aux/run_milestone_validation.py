@@ -6,7 +6,6 @@ This script runs comprehensive validation tests for milestones M1-M3 and generat
 a detailed validation report for the QA testing engineer.
 """
 
-import asyncio
 import json
 import time
 import os
@@ -16,6 +15,7 @@ from typing import Dict, List, Any
 # Import test modules
 from test_m2_command_validation import run_m2_validation
 from test_m3_state_handling import run_m3_validation
+from tests import fast_loop
 
 
 class MilestoneValidationRunner:
@@ -23,6 +23,7 @@ class MilestoneValidationRunner:
     
     def __init__(self):
         self.start_time = time.time()
+        self._browser_manager = None
         self.results = {
             "validation_run": {
                 "timestamp": datetime.now().isoformat(),
@@ -32,6 +33,22 @@ class MilestoneValidationRunner:
             "summary": {}
         }
     
+    async def get_browser_manager(self):
+        """Launch the browser on first use and share it across milestones."""
+        if self._browser_manager is None:
+            from aux.browser.manager import BrowserManager
+            
+            manager = BrowserManager(headless=True)
+            await manager.initialize()
+            self._browser_manager = manager
+        return self._browser_manager
+    
+    async def close_browser_manager(self):
+        """Close the shared browser if it was launched."""
+        if self._browser_manager is not None:
+            await self._browser_manager.close()
+            self._browser_manager = None
+    
     async def run_m1_validation(self):
         """Run M1 DOM extraction validation."""
         print("🔍 M1: DOM Extraction Validation")
@@ -73,11 +90,9 @@ class MilestoneValidationRunner:
         
         # Simple functional test
         try:
-            from aux.browser.manager import BrowserManager
             from aux.schema.commands import NavigateCommand, ExtractCommand, ExtractType, WaitCondition
             
-            manager = BrowserManager(headless=True)
-            await manager.initialize()
+            manager = await self.get_browser_manager()
             session_id = await manager.create_session()
             
             # Test basic navigation and extraction
@@ -123,7 +138,6 @@ class MilestoneValidationRunner:
                 })
             
             await manager.close_session(session_id)
-            await manager.close()
             
         except Exception as e:
             m1_results["tests"].append({
@@ -151,7 +165,7 @@ class MilestoneValidationRunner:
         # Run M2 validation  
         print("🔧 M2: Command Execution Validation")
         try:
-            m2_passed, m2_failed = await run_m2_validation()
+            m2_passed, m2_failed = await run_m2_validation(await self.get_browser_manager())
             m2_results = {
                 "milestone": "M2 - Command Execution",
                 "description": "Accept JSON commands (navigate, click, fill, extract, wait)",
@@ -187,7 +201,7 @@ class MilestoneValidationRunner:
         # Run M3 validation
         print("🔄 M3: State Confirmation and Error Handling Validation")
         try:
-            m3_passed, m3_failed = await run_m3_validation()
+            m3_passed, m3_failed = await run_m3_validation(await self.get_browser_manager())
             m3_results = {
                 "milestone": "M3 - State Confirmation and Error Handling",
                 "description": "Return state confirmation and error handling",
@@ -217,6 +231,8 @@ class MilestoneValidationRunner:
                 "status": "ERROR", 
                 "error": str(e)
             }
+        finally:
+            await self.close_browser_manager()
         
         # Generate summary
         self.generate_summary()
@@ -384,4 +400,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    fast_loop.run(main())
\ No newline at end of file
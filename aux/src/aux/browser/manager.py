@@ -31,6 +31,46 @@ from ..security import SecurityManager
 
 logger = logging.getLogger(__name__)
 
+# Runs a batch of extractions inside the page in a single evaluate() round-trip.
+_BATCH_EXTRACT_SCRIPT = """
+(specs) => specs.map((spec) => {
+    try {
+        const elements = Array.from(document.querySelectorAll(spec.selector));
+        const targets = spec.multiple ? elements : elements.slice(0, 1);
+        const items = targets.map((el, index) => {
+            try {
+                let data;
+                if (spec.extractType === "html") {
+                    data = el.innerHTML;
+                } else if (spec.extractType === "attribute") {
+                    data = el.getAttribute(spec.attributeName);
+                } else if (spec.extractType === "property") {
+                    // Follow dotted paths such as "style.color" like el.<name> does
+                    data = spec.propertyName.split(".").reduce(
+                        (value, key) => (value == null ? undefined : value[key]), el
+                    );
+                } else {
+                    data = el.textContent;
+                }
+                // Surface values evaluate() cannot return as a per-element error
+                JSON.stringify(data);
+                return {
+                    data: data,
+                    tag: el.tagName.toLowerCase(),
+                    class: el.getAttribute("class") || "",
+                    index: index
+                };
+            } catch (e) {
+                return { index: index, error: String(e) };
+            }
+        });
+        return { count: elements.length, items: items };
+    } catch (e) {
+        return { error: String(e) };
+    }
+})
+"""
+
 
 class BrowserSession:
     """
@@ -199,6 +239,10 @@ class BrowserManager:
                 "ignore_https_errors": self.config.ignore_https_errors,
                 "java_script_enabled": True,
                 "accept_downloads": True,
+                # Set on the context so the page needs no extra round-trip
+                "extra_http_headers": {
+                    "Accept-Language": "en-US,en;q=0.9"
+                },
             }
             
             # Add custom user agent if specified
@@ -219,11 +263,6 @@ class BrowserManager:
             # Create initial page
             page = await context.new_page()
             
-            # Set up page-level configurations
-            await page.set_extra_http_headers({
-                "Accept-Language": "en-US,en;q=0.9"
-            })
-            
             # Create session object
             session = BrowserSession(session_id, context, page)
             self.sessions[session_id] = session
@@ -783,6 +822,166 @@ class BrowserManager:
                 error_type="extraction_error"
             )
     
+    async def execute_extract_many(
+        self,
+        commands: List[ExtractCommand]
+    ) -> List[Union[ExtractResponse, ErrorResponse]]:
+        """
+        Execute several extract commands with one page round-trip per session.
+        
+        Results match execute_extract: missing attribute or property names
+        are rejected, dotted property paths are followed, and a failure on
+        one element is recorded in its element_info entry. Unlike
+        execute_extract, selectors are resolved with
+        document.querySelectorAll, so only plain CSS selectors are supported.
+        
+        Args:
+            commands: Extract commands to execute
+            
+        Returns:
+            Extract or error responses aligned with ``commands``
+        """
+        responses: List[Optional[Union[ExtractResponse, ErrorResponse]]] = [None] * len(commands)
+        
+        # Group commands by session so each page is evaluated once
+        by_session: Dict[str, List[int]] = {}
+        for index, command in enumerate(commands):
+            by_session.setdefault(command.session_id, []).append(index)
+        
+        for session_id, indices in by_session.items():
+            session = await self.get_session(session_id)
+            
+            if not session:
+                for index in indices:
+                    responses[index] = create_error_response(
+                        command_id=commands[index].id,
+                        error_message=f"Session {session_id} not found",
+                        error_code=ErrorCodes.SESSION_NOT_FOUND,
+                        error_type="session_error"
+                    )
+                continue
+            
+            # Reject commands missing the name their extract type needs, as
+            # execute_extract does, before any of them reach the page
+            valid_indices = []
+            for index in indices:
+                error_message = self._batch_extract_argument_error(commands[index])
+                if error_message:
+                    responses[index] = create_error_response(
+                        command_id=commands[index].id,
+                        error_message=f"Extract failed: {error_message}",
+                        error_code=ErrorCodes.EXTRACTION_FAILED,
+                        error_type="extraction_error"
+                    )
+                else:
+                    valid_indices.append(index)
+            indices = valid_indices
+            if not indices:
+                continue
+            
+            specs = [
+                {
+                    "selector": commands[index].selector,
+                    "extractType": commands[index].extract_type.value,
+                    "attributeName": commands[index].attribute_name,
+                    "propertyName": commands[index].property_name,
+                    "multiple": commands[index].multiple,
+                }
+                for index in indices
+            ]
+            
+            try:
+                logger.info(f"Extracting batch of {len(specs)} selectors (session: {session_id})")
+                batch_results = await session.page.evaluate(_BATCH_EXTRACT_SCRIPT, specs)
+            except Exception as e:
+                logger.error(f"Batch extract failed: {e}")
+                for index in indices:
+                    responses[index] = create_error_response(
+                        command_id=commands[index].id,
+                        error_message=f"Extract failed: {str(e)}",
+                        error_code=ErrorCodes.EXTRACTION_FAILED,
+                        error_type="extraction_error"
+                    )
+                continue
+            
+            for index, batch_result in zip(indices, batch_results):
+                responses[index] = self._build_batch_extract_response(
+                    commands[index], batch_result
+                )
+        
+        return responses
+    
+    def _batch_extract_argument_error(self, command: ExtractCommand) -> Optional[str]:
+        """Return why an extract command cannot be batched, or None if it can."""
+        if command.extract_type == ExtractType.ATTRIBUTE and not command.attribute_name:
+            return "attribute_name required for attribute extraction"
+        if command.extract_type == ExtractType.PROPERTY and not command.property_name:
+            return "property_name required for property extraction"
+        return None
+    
+    def _build_batch_extract_response(
+        self,
+        command: ExtractCommand,
+        batch_result: Dict[str, Any]
+    ) -> Union[ExtractResponse, ErrorResponse]:
+        """Convert one in-page batch extraction result into a response."""
+        if "error" in batch_result:
+            return create_error_response(
+                command_id=command.id,
+                error_message=f"Extract failed: {batch_result['error']}",
+                error_code=ErrorCodes.EXTRACTION_FAILED,
+                error_type="extraction_error"
+            )
+        
+        if batch_result["count"] == 0:
+            return create_error_response(
+                command_id=command.id,
+                error_message=f"No elements found: {command.selector}",
+                error_code=ErrorCodes.ELEMENT_NOT_FOUND,
+                error_type="element_error"
+            )
+        
+        extracted_data = []
+        element_info = []
+        
+        for item in batch_result["items"]:
+            if "error" in item:
+                logger.warning(f"Error extracting from element {item['index']}: {item['error']}")
+                extracted_data.append("")
+                element_info.append({
+                    "tag": "unknown",
+                    "class": "",
+                    "index": item["index"],
+                    "error": item["error"]
+                })
+                continue
+            
+            data = item["data"]
+            if command.extract_type == ExtractType.TEXT and command.trim_whitespace and data:
+                data = data.strip()
+            
+            extracted_data.append(data or "")
+            element_info.append({
+                "tag": item["tag"],
+                "class": item["class"],
+                "index": item["index"]
+            })
+        
+        if command.multiple:
+            response_data = extracted_data
+        else:
+            response_data = extracted_data[0] if extracted_data else ""
+        
+        self.total_commands_executed += 1
+        
+        return ExtractResponse(
+            id=command.id,
+            timestamp=time.time(),
+            elements_found=batch_result["count"],
+            data=response_data,
+            element_info=element_info
+        )
+    
     async def execute_wait(self, command: WaitCommand) -> Union[WaitResponse, ErrorResponse]:
         """
         Execute wait command with flexible condition support.
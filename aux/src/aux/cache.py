@@ -6,6 +6,7 @@ performance for repeated operations and reduce browser overhead.
 """
 
 import hashlib
+import heapq
 import json
 import time
 import logging
@@ -124,12 +125,26 @@ class CommandCache:
         filtered_data = {k: v for k, v in cache_data.items() if v is not None}
         normalized_json = json.dumps(filtered_data, sort_keys=True)
         
-        return hashlib.sha256(normalized_json.encode()).hexdigest()[:16]
+        # blake2b is cheaper than sha256 and these keys never leave the process
+        return hashlib.blake2b(normalized_json.encode(), digest_size=8).hexdigest()
     
     def _generate_cache_key(self, session_id: str, command_hash: str) -> str:
         """Generate cache key for command."""
         return f"{session_id}:{command_hash}"
     
+    def compute_cache_key(self, session_id: str, command_data: Dict[str, Any]) -> str:
+        """
+        Compute the cache key for a command so callers can reuse it.
+        
+        Args:
+            session_id: Browser session ID
+            command_data: Command data dictionary
+            
+        Returns:
+            Cache key string
+        """
+        return self._generate_cache_key(session_id, self._hash_command(command_data))
+    
     def _get_page_state_hash(self, session_id: str, page_url: str, page_title: str) -> str:
         """
         Generate page state hash for invalidation detection.
@@ -198,6 +213,47 @@ class CommandCache:
         Returns:
             Cached result if available, None otherwise
         """
+        return self._lookup(session_id, command_data, current_page_url, current_page_title)
+    
+    async def get_cached_result_many(self,
+                                     requests: List[Tuple[str, Dict[str, Any]]],
+                                     current_page_url: str = "",
+                                     current_page_title: str = "",
+                                     cache_keys: Optional[List[str]] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve cached results for a batch of commands in one call.
+        
+        Args:
+            requests: List of (session_id, command_data) pairs
+            current_page_url: Current page URL for state validation
+            current_page_title: Current page title for state validation
+            cache_keys: Optional keys from compute_cache_key, aligned with ``requests``
+            
+        Returns:
+            List of cached results (or None) aligned with ``requests``
+            
+        Raises:
+            ValueError: If ``cache_keys`` and ``requests`` differ in length
+        """
+        if cache_keys is None:
+            cache_keys = [None] * len(requests)
+        elif len(cache_keys) != len(requests):
+            raise ValueError(
+                f"cache_keys has {len(cache_keys)} entries but requests has {len(requests)}"
+            )
+        
+        return [
+            self._lookup(session_id, command_data, current_page_url, current_page_title, cache_key)
+            for (session_id, command_data), cache_key in zip(requests, cache_keys)
+        ]
+    
+    def _lookup(self,
+                session_id: str,
+                command_data: Dict[str, Any],
+                current_page_url: str,
+                current_page_title: str,
+                cache_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Look up a single command result, updating hit/miss statistics."""
         self.stats['total_requests'] += 1
         
         # Check if command is cacheable
@@ -205,9 +261,9 @@ class CommandCache:
         if cacheability != Cacheability.CACHEABLE:
             return None
         
-        # Generate cache key
-        command_hash = self._hash_command(command_data)
-        cache_key = self._generate_cache_key(session_id, command_hash)
+        # Generate cache key unless the caller precomputed it
+        if cache_key is None:
+            cache_key = self.compute_cache_key(session_id, command_data)
         
         # Check if entry exists
         if cache_key not in self.cache:
@@ -260,18 +316,85 @@ class CommandCache:
             current_page_title: Current page title for state tracking
             custom_ttl: Custom TTL override for this entry
         """
+        entry = self._build_entry(
+            session_id, command_data, result,
+            current_page_url, current_page_title, custom_ttl
+        )
+        if entry is None:
+            return
+        
+        # Check if cache is full and evict if necessary
+        if len(self.cache) >= self.max_entries:
+            await self._evict_oldest_entries()
+        
+        self.cache[entry.key] = entry
+        logger.debug(f"Cached result for {command_data.get('method')} command")
+    
+    async def cache_result_many(self,
+                                items: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+                                current_page_url: str = "",
+                                current_page_title: str = "",
+                                custom_ttl: Optional[int] = None,
+                                cache_keys: Optional[List[str]] = None) -> None:
+        """
+        Cache a batch of command results in one call.
+        
+        Args:
+            items: List of (session_id, command_data, result) tuples
+            current_page_url: Current page URL for state tracking
+            current_page_title: Current page title for state tracking
+            custom_ttl: Custom TTL override for these entries
+            cache_keys: Optional keys from compute_cache_key, aligned with ``items``
+            
+        Raises:
+            ValueError: If ``cache_keys`` and ``items`` differ in length
+        """
+        if cache_keys is None:
+            cache_keys = [None] * len(items)
+        elif len(cache_keys) != len(items):
+            raise ValueError(
+                f"cache_keys has {len(cache_keys)} entries but items has {len(items)}"
+            )
+        
+        for (session_id, command_data, result), cache_key in zip(items, cache_keys):
+            entry = self._build_entry(
+                session_id, command_data, result,
+                current_page_url, current_page_title, custom_ttl, cache_key
+            )
+            if entry is None:
+                continue
+            
+            if len(self.cache) >= self.max_entries:
+                await self._evict_oldest_entries()
+            
+            self.cache[entry.key] = entry
+        
+        logger.debug(f"Cached batch of {len(items)} command results")
+    
+    def _build_entry(self,
+                     session_id: str,
+                     command_data: Dict[str, Any],
+                     result: Dict[str, Any],
+                     current_page_url: str,
+                     current_page_title: str,
+                     custom_ttl: Optional[int],
+                     cache_key: Optional[str] = None) -> Optional[CacheEntry]:
+        """Build a cache entry for a result, or None if it must not be cached."""
         # Check if command is cacheable
         cacheability = self.can_cache_command(command_data)
         if cacheability != Cacheability.CACHEABLE:
-            return
+            return None
         
         # Only cache successful results
         if not result.get('success', False):
-            return
+            return None
         
-        # Generate cache key
-        command_hash = self._hash_command(command_data)
-        cache_key = self._generate_cache_key(session_id, command_hash)
+        # Generate cache key unless the caller precomputed it
+        if cache_key is None:
+            command_hash = self._hash_command(command_data)
+            cache_key = self._generate_cache_key(session_id, command_hash)
+        else:
+            command_hash = cache_key.rpartition(':')[2]
         
         # Generate page state hash if enabled
         page_state_hash = None
@@ -281,8 +404,7 @@ class CommandCache:
             )
             self.session_page_states[session_id] = page_state_hash
         
-        # Create cache entry
-        entry = CacheEntry(
+        return CacheEntry(
             key=cache_key,
             command_hash=command_hash,
             result=result.copy(),
@@ -290,13 +412,6 @@ class CommandCache:
             ttl_seconds=custom_ttl or self.default_ttl,
             page_state_hash=page_state_hash
         )
-        
-        # Check if cache is full and evict if necessary
-        if len(self.cache) >= self.max_entries:
-            await self._evict_oldest_entries()
-        
-        self.cache[cache_key] = entry
-        logger.debug(f"Cached result for {command_data.get('method')} command")
     
     async def invalidate_session(self, session_id: str) -> None:
         """
@@ -377,15 +492,16 @@ class CommandCache:
         if count is None:
             count = max(1, self.max_entries // 10)
         
-        # Sort entries by last accessed time (LRU eviction)
-        sorted_entries = sorted(
+        # Select the least recently used entries without sorting the whole
+        # cache; only the victims need to be ordered
+        oldest_entries = heapq.nsmallest(
+            count,
             self.cache.items(),
             key=lambda x: x[1].last_accessed or x[1].timestamp
         )
         
         # Remove oldest entries
-        for i in range(min(count, len(sorted_entries))):
-            key = sorted_entries[i][0]
+        for key, _ in oldest_entries:
             del self.cache[key]
             self.stats['evictions'] += 1
         
@@ -430,6 +546,12 @@ class CommandCache:
         self.cache.clear()
         self.session_page_states.clear()
         logger.info("Cache cleared")
+    
+    def reset(self) -> None:
+        """Clear all cache entries and reset statistics, keeping configuration."""
+        self.clear()
+        for key in self.stats:
+            self.stats[key] = 0
 
 
 # Global cache instance
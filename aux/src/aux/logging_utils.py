@@ -14,6 +14,18 @@ from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any) -> str:
+    """Serialize log data to compact JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, default=str, separators=(',', ':'))
+
 
 class LogEventType(str, Enum):
     """Types of log events for structured logging."""
@@ -56,7 +68,7 @@ class LogEvent:
     
     def to_json(self) -> str:
         """Convert log event to JSON string."""
-        return json.dumps(self.to_dict(), default=str, separators=(',', ':'))
+        return _dumps(self.to_dict())
 
 
 class SessionLogger:
@@ -67,7 +79,8 @@ class SessionLogger:
     and system events for analysis and debugging.
     """
     
-    def __init__(self, log_file_path: str = "session.log", max_file_size_mb: int = 100, backup_count: int = 5):
+    def __init__(self, log_file_path: str = "session.log", max_file_size_mb: int = 100, backup_count: int = 5,
+                 buffer_capacity: int = 0):
         """
         Initialize session logger.
         
@@ -75,6 +88,8 @@ class SessionLogger:
             log_file_path: Path to session log file
             max_file_size_mb: Maximum log file size before rotation
             backup_count: Number of backup files to keep
+            buffer_capacity: Number of events to buffer in memory before writing
+                (0 writes every event immediately)
         """
         self.log_file_path = log_file_path
         self.logger = logging.getLogger("aux.session")
@@ -95,7 +110,21 @@ class SessionLogger:
         formatter = logging.Formatter('%(message)s')
         handler.setFormatter(formatter)
         
-        # Clear existing handlers and add our handler
+        # Optionally batch writes; errors and session ends still flush promptly
+        if buffer_capacity > 0:
+            handler = logging.handlers.MemoryHandler(
+                buffer_capacity,
+                flushLevel=logging.ERROR,
+                target=handler
+            )
+        
+        # Close existing handlers (flushing any buffered events) and add ours;
+        # MemoryHandler.close() leaves its target open, so close that too
+        for existing_handler in self.logger.handlers:
+            existing_handler.close()
+            target = getattr(existing_handler, "target", None)
+            if target is not None:
+                target.close()
         self.logger.handlers.clear()
         self.logger.addHandler(handler)
         self.logger.setLevel(logging.INFO)
@@ -129,6 +158,11 @@ class SessionLogger:
             if event.command_id:
                 session_info['command_count'] += 1
     
+    def flush(self) -> None:
+        """Write any buffered events to the log file."""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
     def log_session_start(self, session_id: str, client_ip: Optional[str] = None, **kwargs) -> None:
         """Log session start event."""
         event = LogEvent(
@@ -158,6 +192,7 @@ class SessionLogger:
             }
         )
         self.log_event(event)
+        self.flush()
     
     def log_command_received(self, session_id: str, command_id: str, method: str, 
                            command_data: Dict[str, Any], client_ip: Optional[str] = None) -> None:
@@ -401,19 +436,21 @@ session_logger: Optional[SessionLogger] = None
 state_tracker = StateTracker()
 
 
-def init_session_logging(log_file_path: str = "session.log", max_file_size_mb: int = 100) -> SessionLogger:
+def init_session_logging(log_file_path: str = "session.log", max_file_size_mb: int = 100,
+                         buffer_capacity: int = 0) -> SessionLogger:
     """
     Initialize global session logging.
     
     Args:
         log_file_path: Path to session log file
         max_file_size_mb: Maximum log file size before rotation
+        buffer_capacity: Number of events to buffer in memory before writing
         
     Returns:
         Initialized session logger
     """
     global session_logger
-    session_logger = SessionLogger(log_file_path, max_file_size_mb)
+    session_logger = SessionLogger(log_file_path, max_file_size_mb, buffer_capacity=buffer_capacity)
     return session_logger
 
 
@@ -56,9 +56,33 @@ class InputSanitizer:
         r'</script>',
     ]
     
+    # Functions rejected in custom JavaScript
+    DANGEROUS_JS_FUNCTIONS = [
+        'eval', 'Function', 'setTimeout', 'setInterval',
+        'XMLHttpRequest', 'fetch', 'import', 'require'
+    ]
+    
     # Allowed URL schemes
     ALLOWED_URL_SCHEMES = {'http', 'https'}
     
+    # Patterns compiled once at import and shared by all instances; each
+    # list is also folded into a single alternation so one scan suffices
+    js_patterns = [re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in JS_INJECTION_PATTERNS]
+    css_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in CSS_INJECTION_PATTERNS]
+    _JS_INJECTION_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in JS_INJECTION_PATTERNS),
+        re.IGNORECASE | re.DOTALL
+    )
+    _CSS_INJECTION_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in CSS_INJECTION_PATTERNS),
+        re.IGNORECASE
+    )
+    _DANGEROUS_JS_FUNCTION_RE = re.compile(
+        r'\b(' + '|'.join(DANGEROUS_JS_FUNCTIONS) + r')\s*\(',
+        re.IGNORECASE
+    )
+    _DANGEROUS_JS_FUNCTION_NAMES = {func.lower(): func for func in DANGEROUS_JS_FUNCTIONS}
+    
     def __init__(self, max_selector_length: int = 1000, max_text_length: int = 10000, max_url_length: int = 2048):
         """
         Initialize input sanitizer.
@@ -71,10 +95,6 @@ class InputSanitizer:
         self.max_selector_length = max_selector_length
         self.max_text_length = max_text_length
         self.max_url_length = max_url_length
-        
-        # Compile regex patterns for performance
-        self.js_patterns = [re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in self.JS_INJECTION_PATTERNS]
-        self.css_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.CSS_INJECTION_PATTERNS]
     
     def sanitize_selector(self, selector: str) -> str:
         """
@@ -96,9 +116,8 @@ class InputSanitizer:
             raise ValueError(f"Selector too long (max {self.max_selector_length} characters)")
         
         # Check for dangerous patterns
-        for pattern in self.css_patterns:
-            if pattern.search(selector):
-                raise ValueError(f"Potentially dangerous selector pattern detected")
+        if self._CSS_INJECTION_RE.search(selector):
+            raise ValueError(f"Potentially dangerous selector pattern detected")
         
         # Basic selector validation
         if not self._is_valid_css_selector(selector):
@@ -123,9 +142,8 @@ class InputSanitizer:
             raise ValueError(f"Text too long (max {self.max_text_length} characters)")
         
         # Check for JavaScript injection patterns
-        for pattern in self.js_patterns:
-            if pattern.search(text):
-                raise ValueError("Potentially dangerous script content detected")
+        if self._JS_INJECTION_RE.search(text):
+            raise ValueError("Potentially dangerous script content detected")
         
         return text
     
@@ -156,9 +174,8 @@ class InputSanitizer:
                 raise ValueError(f"URL scheme '{parsed.scheme}' not allowed")
             
             # Check for dangerous patterns
-            for pattern in self.js_patterns:
-                if pattern.search(url):
-                    raise ValueError("Potentially dangerous URL content detected")
+            if self._JS_INJECTION_RE.search(url):
+                raise ValueError("Potentially dangerous URL content detected")
             
             return url.strip()
             
@@ -185,14 +202,10 @@ class InputSanitizer:
             raise ValueError("JavaScript code too long")
         
         # Check for dangerous patterns
-        dangerous_functions = [
-            'eval', 'Function', 'setTimeout', 'setInterval',
-            'XMLHttpRequest', 'fetch', 'import', 'require'
-        ]
-        
-        for func in dangerous_functions:
-            if re.search(rf'\b{func}\s*\(', js_code, re.IGNORECASE):
-                raise ValueError(f"Dangerous function '{func}' not allowed")
+        match = self._DANGEROUS_JS_FUNCTION_RE.search(js_code)
+        if match:
+            func = self._DANGEROUS_JS_FUNCTION_NAMES[match.group(1).lower()]
+            raise ValueError(f"Dangerous function '{func}' not allowed")
         
         return js_code.strip()
     
@@ -250,6 +263,9 @@ class SecureAuthenticator:
         self.api_key = api_key
         self.auth_enabled = api_key is not None
         
+        # Encode the expected key once rather than on every comparison
+        self._api_key_bytes = api_key.encode('utf-8') if api_key else None
+        
     def authenticate(self, provided_key: Optional[str]) -> bool:
         """
         Authenticate using API key with timing-safe comparison.
@@ -263,14 +279,14 @@ class SecureAuthenticator:
         if not self.auth_enabled:
             return True
             
-        if not provided_key or not self.api_key:
+        if not provided_key or not self._api_key_bytes:
             return False
         
-        # Use secrets.compare_digest for timing-safe comparison
+        # Use hmac.compare_digest on bytes for timing-safe comparison
         try:
-            return secrets.compare_digest(self.api_key, provided_key)
-        except TypeError:
-            # Handle case where inputs are not strings
+            return hmac.compare_digest(self._api_key_bytes, provided_key.encode('utf-8'))
+        except (AttributeError, TypeError):
+            # Handle case where the provided key is not a string
             return False
     
     def generate_api_key(self) -> str:
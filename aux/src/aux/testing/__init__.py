@@ -5,10 +5,21 @@ This module provides comprehensive testing capabilities for the AUX protocol,
 including mock agents, test scenario execution, and performance benchmarking.
 """
 
-from .mock_agent import MockAgent, AgentBehavior
-from .scenario_runner import ScenarioRunner, TestScenario
-from .test_harness import TestHarness, TestResults, TestConfiguration
-from .reporting import TestReporter, TestMetrics
+import importlib
+
+# Submodules are imported on first attribute access so that importing a
+# lightweight piece (e.g. TestConfiguration) does not load the whole framework.
+_LAZY_IMPORTS = {
+    "MockAgent": ".mock_agent",
+    "AgentBehavior": ".mock_agent",
+    "ScenarioRunner": ".scenario_runner",
+    "TestScenario": ".scenario_runner",
+    "TestHarness": ".test_harness",
+    "TestResults": ".test_harness",
+    "TestConfiguration": ".test_harness",
+    "TestReporter": ".reporting",
+    "TestMetrics": ".reporting",
+}
 
 __all__ = [
     "MockAgent",
@@ -20,4 +31,13 @@ __all__ = [
     "TestConfiguration",
     "TestReporter",
     "TestMetrics",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
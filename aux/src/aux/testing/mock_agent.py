@@ -43,6 +43,7 @@ class AgentBehavior:
     thinking_delay_range: tuple[float, float] = (0.5, 2.0)  # seconds
     typing_speed_range: tuple[int, int] = (50, 120)  # characters per minute
     action_delay_range: tuple[float, float] = (0.2, 0.8)  # seconds between actions
+    fast_forward: bool = False  # compute delays but only yield instead of sleeping
     
     # Error handling
     retry_attempts: int = 3
@@ -158,15 +159,22 @@ class MockAgent:
         self.validation_rules.append(rule)
         self.logger.debug(f"Added validation rule: {rule.name}")
     
-    async def simulate_thinking(self, context: str = "") -> None:
+    async def _pause(self, seconds: float) -> None:
+        """Sleep for a simulated delay, or just yield when fast-forwarding."""
+        await asyncio.sleep(0 if self.behavior.fast_forward else seconds)
+    
+    async def simulate_thinking(self, context: str = "") -> float:
         """
         Simulate agent thinking time with realistic delays.
         
         Args:
             context: Context for the thinking (for logging)
+            
+        Returns:
+            Simulated thinking time in seconds
         """
         if not self.behavior.add_natural_delays:
-            return
+            return 0.0
             
         self.state = AgentState.THINKING
         
@@ -176,7 +184,9 @@ class MockAgent:
         think_time = max(0.1, base_delay + variation)
         
         self.logger.debug(f"Agent {self.agent_id} thinking for {think_time:.2f}s ({context})")
-        await asyncio.sleep(think_time)
+        await self._pause(think_time)
+        
+        return think_time
     
     async def simulate_typing(self, text: str) -> float:
         """
@@ -205,7 +215,7 @@ class MockAgent:
         total_time = max(0.1, base_time + variation + pause_time)
         
         self.logger.debug(f"Simulating typing '{text[:30]}...' for {total_time:.2f}s")
-        await asyncio.sleep(total_time)
+        await self._pause(total_time)
         
         return total_time
     
@@ -243,7 +253,7 @@ class MockAgent:
         # Add natural delay before action
         if self.behavior.add_natural_delays:
             delay = random.uniform(*self.behavior.action_delay_range)
-            await asyncio.sleep(delay)
+            await self._pause(delay)
         
         try:
             # Execute the command
@@ -326,7 +336,7 @@ class MockAgent:
         retry_delay = base_delay * (2 ** retry_count)
         
         self.logger.info(f"Attempting recovery for {failed_command.method} (retry {retry_count + 1})")
-        await asyncio.sleep(retry_delay)
+        await self._pause(retry_delay)
         
         # Simulate thinking about the error
         await self.simulate_thinking("error recovery")
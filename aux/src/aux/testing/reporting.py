@@ -5,15 +5,47 @@ This module provides comprehensive test reporting capabilities including
 HTML reports, JSON metrics export, and detailed performance analysis.
 """
 
+import asyncio
 import json
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, is_dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import logging
 
 from .scenario_runner import ScenarioResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Convert dataclasses to dicts and anything else unknown to a string."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return str(value)
+
+
+def _dumps_metrics(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize metrics to indented JSON bytes, using orjson when available.
+    
+    orjson encodes dataclasses natively, so metrics objects can be passed
+    through without an asdict() copy.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+
+async def _write_bytes(path: Path, data: bytes) -> None:
+    """Write a report file in one call on the default executor, off the event loop."""
+    await asyncio.get_running_loop().run_in_executor(None, path.write_bytes, data)
+
 
 @dataclass
 class TestMetrics:
@@ -78,8 +110,7 @@ class TestReporter:
         html_content = self._build_html_report(results)
         
         output_path = Path(output_path)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        await _write_bytes(output_path, html_content.encode('utf-8'))
         
         self.logger.info(f"HTML report generated: {output_path}")
     
@@ -565,7 +596,7 @@ class TestReporter:
                 'start_time': results.start_time,
                 'end_time': results.end_time
             },
-            'metrics': asdict(results.metrics) if results.metrics else {},
+            'metrics': results.metrics or {},
             'scenarios': [
                 {
                     'name': r.scenario_name,
@@ -584,8 +615,7 @@ class TestReporter:
         }
         
         output_path = Path(output_path)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(metrics_data, f, indent=2, default=str)
+        await _write_bytes(output_path, _dumps_metrics(metrics_data))
         
         self.logger.info(f"JSON metrics saved: {output_path}")
     
@@ -652,8 +682,7 @@ class TestReporter:
                 lines.append(f"- {error}")
         
         output_path = Path(output_path)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        await _write_bytes(output_path, '\n'.join(lines).encode('utf-8'))
         
         self.logger.info(f"Detailed logs saved: {output_path}")
     
@@ -15,9 +15,18 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import logging
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 from .mock_agent import MockAgent, AgentState, AgentBehavior
 # Using standard logging
 
+# Top-level keys every scenario file must define, in reporting order
+REQUIRED_SCENARIO_FIELDS = ('name', 'description', 'steps')
+REQUIRED_SCENARIO_FIELDS_SET = frozenset(REQUIRED_SCENARIO_FIELDS)
+
 
 @dataclass
 class TestStep:
@@ -126,7 +135,7 @@ class ScenarioRunner:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 if file_path.suffix.lower() in ['.yaml', '.yml']:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=YAMLLoader)
                 elif file_path.suffix.lower() == '.json':
                     data = json.load(f)
                 else:
@@ -141,11 +150,12 @@ class ScenarioRunner:
     def _parse_scenario_data(self, data: Dict[str, Any]) -> TestScenario:
         """Parse scenario data into TestScenario object."""
         
-        # Validate required fields
-        required_fields = ['name', 'description', 'steps']
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field: {field}")
+        # Validate required fields; the common valid case is one subset check
+        if not isinstance(data, dict):
+            raise ValueError(f"Scenario must be a mapping, got {type(data).__name__}")
+        if not data.keys() >= REQUIRED_SCENARIO_FIELDS_SET:
+            missing = next(field for field in REQUIRED_SCENARIO_FIELDS if field not in data)
+            raise ValueError(f"Missing required field: {missing}")
         
         # Parse steps
         steps = []
@@ -6,20 +6,61 @@ managing multiple agents, and providing comprehensive test orchestration
 with parallel and sequential execution modes.
 """
 
+from __future__ import annotations
+
 import asyncio
+import importlib
 import json
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, Callable
 import logging
 
-from .mock_agent import MockAgent, AgentBehavior
-from .scenario_runner import ScenarioRunner, TestScenario, ScenarioResult
-from .reporting import TestReporter, TestMetrics
+# Runner, agent and reporting modules pull in YAML, the client SDK and the
+# report templates, so they are imported where they are first needed.
+if TYPE_CHECKING:
+    from .mock_agent import MockAgent, AgentBehavior
+    from .scenario_runner import ScenarioRunner, TestScenario, ScenarioResult
+    from .reporting import TestReporter, TestMetrics
 # Using standard logging
 
+# Names this module used to import eagerly, still importable from it
+_LAZY_IMPORTS = {
+    'MockAgent': '.mock_agent',
+    'AgentBehavior': '.mock_agent',
+    'ScenarioRunner': '.scenario_runner',
+    'TestScenario': '.scenario_runner',
+    'ScenarioResult': '.scenario_runner',
+    'TestReporter': '.reporting',
+    'TestMetrics': '.reporting',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported runner, agent and reporting names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+SCENARIO_FILE_EXTENSIONS = ('.yaml', '.json')
+
+
+def _iter_scenario_files(directory: Union[str, Path]):
+    """Yield scenario file paths under a directory in a single scandir pass."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_scenario_files(entry.path)
+            elif entry.name.endswith(SCENARIO_FILE_EXTENSIONS):
+                yield entry.path
+
 
 @dataclass
 class TestConfiguration:
@@ -128,6 +169,7 @@ class TestHarness:
         self.agent_pool: List[MockAgent] = []
         
         # Reporting
+        from .reporting import TestReporter
         self.reporter = TestReporter(logger=self.logger)
         
         self.logger.info("TestHarness initialized")
@@ -155,76 +197,65 @@ class TestHarness:
             
             if path.is_file():
                 # Load single scenario file
-                try:
-                    runner = ScenarioRunner(
-                        self.config.server_url,
-                        self.config.default_behavior,
-                        self.logger
-                    )
-                    scenario = runner.load_scenario_file(path)
+                scenario = self._load_scenario_path(path)
+                if scenario is not None:
                     scenarios.append(scenario)
-                    self.logger.debug(f"Loaded scenario: {scenario.name}")
-                except Exception as e:
-                    self.logger.error(f"Failed to load scenario {path}: {e}")
                     
             elif path.is_dir():
-                # Load all scenario files in directory
-                for file_path in path.glob("**/*.yaml"):
-                    try:
-                        runner = ScenarioRunner(
-                            self.config.server_url,
-                            self.config.default_behavior,
-                            self.logger
-                        )
-                        scenario = runner.load_scenario_file(file_path)
+                # Load all scenario files in directory with a single tree walk
+                for file_path in _iter_scenario_files(path):
+                    scenario = self._load_scenario_path(Path(file_path))
+                    if scenario is not None:
                         scenarios.append(scenario)
-                        self.logger.debug(f"Loaded scenario: {scenario.name}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to load scenario {file_path}: {e}")
-                
-                for file_path in path.glob("**/*.json"):
-                    try:
-                        runner = ScenarioRunner(
-                            self.config.server_url,
-                            self.config.default_behavior,
-                            self.logger
-                        )
-                        scenario = runner.load_scenario_file(file_path)
-                        scenarios.append(scenario)
-                        self.logger.debug(f"Loaded scenario: {scenario.name}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to load scenario {file_path}: {e}")
             else:
-                self.logger.warning(f"Path does not exist: {path}")
+                self.logger.warning("Path does not exist: %s", path)
         
         # Apply filtering if configured
         scenarios = self._filter_scenarios(scenarios)
         
-        self.logger.info(f"Loaded {len(scenarios)} scenarios for execution")
+        self.logger.info("Loaded %d scenarios for execution", len(scenarios))
         return scenarios
     
+    def _load_scenario_path(self, path: Path) -> Optional[TestScenario]:
+        """Load a single scenario file, logging and skipping it on failure."""
+        from .scenario_runner import ScenarioRunner
+        
+        try:
+            runner = ScenarioRunner(
+                self.config.server_url,
+                self.config.default_behavior,
+                self.logger
+            )
+            scenario = runner.load_scenario_file(path)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Loaded scenario: %s", scenario.name)
+            return scenario
+        except Exception as e:
+            self.logger.error("Failed to load scenario %s: %s", path, e)
+            return None
+    
     def _filter_scenarios(self, scenarios: List[TestScenario]) -> List[TestScenario]:
         """Filter scenarios based on configuration tags."""
         
         if not self.config.scenario_filter_tags and not self.config.exclude_tags:
             return scenarios
         
+        include_tags = frozenset(self.config.scenario_filter_tags or ())
+        exclude_tags = frozenset(self.config.exclude_tags or ())
         filtered = []
         
         for scenario in scenarios:
-            scenario_tags = scenario.tags or []
+            scenario_tags = scenario.tags or ()
             
             # Check include filters
-            if self.config.scenario_filter_tags:
-                if not any(tag in scenario_tags for tag in self.config.scenario_filter_tags):
-                    self.logger.debug(f"Scenario {scenario.name} filtered out (missing required tags)")
-                    continue
+            if include_tags and include_tags.isdisjoint(scenario_tags):
+                self.logger.debug("Scenario %s filtered out (missing required tags)", scenario.name)
+                continue
             
             # Check exclude filters
-            if self.config.exclude_tags:
-                if any(tag in scenario_tags for tag in self.config.exclude_tags):
-                    self.logger.debug(f"Scenario {scenario.name} filtered out (has excluded tag)")
-                    continue
+            if exclude_tags and not exclude_tags.isdisjoint(scenario_tags):
+                self.logger.debug("Scenario %s filtered out (has excluded tag)", scenario.name)
+                continue
             
             filtered.append(scenario)
         
@@ -292,9 +323,10 @@ class TestHarness:
     
     async def _run_scenarios_sequential(self, scenarios: List[TestScenario]) -> None:
         """Execute scenarios sequentially."""
+        from .scenario_runner import ScenarioRunner, ScenarioResult
         
         for i, scenario in enumerate(scenarios):
-            self.logger.info(f"Executing scenario {i+1}/{len(scenarios)}: {scenario.name}")
+            self.logger.info("Executing scenario %d/%d: %s", i + 1, len(scenarios), scenario.name)
             
             try:
                 # Create dedicated runner for this scenario
@@ -336,7 +368,7 @@ class TestHarness:
                     agent_metrics={}
                 )
                 self.current_results.scenario_results.append(error_result)
-                self.logger.error(f"Scenario {scenario.name} timed out")
+                self.logger.error("Scenario %s timed out", scenario.name)
                 
             except Exception as e:
                 error_result = ScenarioResult(
@@ -354,10 +386,11 @@ class TestHarness:
                     agent_metrics={}
                 )
                 self.current_results.scenario_results.append(error_result)
-                self.logger.error(f"Scenario {scenario.name} failed with exception: {e}")
+                self.logger.error("Scenario %s failed with exception: %s", scenario.name, e)
     
     async def _run_scenarios_parallel(self, scenarios: List[TestScenario]) -> None:
         """Execute scenarios in parallel with controlled concurrency."""
+        from .scenario_runner import ScenarioRunner, ScenarioResult
         
         semaphore = asyncio.Semaphore(self.config.max_parallel_agents)
         
@@ -389,13 +422,14 @@ class TestHarness:
                 completed += 1
                 
                 self.logger.info(
-                    f"Completed scenario {completed}/{len(scenarios)}: "
-                    f"{result.scenario_name} ({'PASS' if result.success else 'FAIL'})"
+                    "Completed scenario %d/%d: %s (%s)",
+                    completed, len(scenarios), result.scenario_name,
+                    'PASS' if result.success else 'FAIL'
                 )
                 
             except Exception as e:
                 completed += 1
-                self.logger.error(f"Scenario failed with exception: {e}")
+                self.logger.error("Scenario failed with exception: %s", e)
                 # Add error scenario result
                 error_result = ScenarioResult(
                     scenario_name="Unknown",
@@ -424,21 +458,21 @@ class TestHarness:
     
     def _generate_test_metrics(self) -> TestMetrics:
         """Generate comprehensive test metrics."""
+        from .reporting import TestMetrics
         
         if not self.current_results.scenario_results:
             return TestMetrics()
         
-        # Collect timing data
-        execution_times = [r.execution_time for r in self.current_results.scenario_results]
-        
-        # Collect step data
-        total_steps = sum(r.total_steps for r in self.current_results.scenario_results)
-        passed_steps = sum(r.passed_steps for r in self.current_results.scenario_results)
-        failed_steps = sum(r.failed_steps for r in self.current_results.scenario_results)
-        
-        # Collect agent metrics
+        # Collect timing, step and agent data in a single pass
+        execution_times = []
+        total_steps = passed_steps = failed_steps = 0
         agent_data = {}
         for result in self.current_results.scenario_results:
+            execution_times.append(result.execution_time)
+            total_steps += result.total_steps
+            passed_steps += result.passed_steps
+            failed_steps += result.failed_steps
+            
             if result.agent_metrics:
                 for key, value in result.agent_metrics.items():
                     if key not in agent_data:
@@ -10,33 +10,108 @@ This module validates the DOM extraction functionality required for Milestone M1
 """
 
 import asyncio
-import json
 import time
+import orjson
 import pytest
+import pytest_asyncio
 from typing import Dict, Any, List
 from aux.browser.manager import BrowserManager
 from aux.schema.commands import NavigateCommand, ExtractCommand, ExtractType, WaitCondition
+from tests import fast_loop
+from tests.page_server import LocalPageServer
+
+
+async def _probe_site(
+    manager: BrowserManager,
+    session_id: str,
+    site_url: str,
+    index: int
+) -> Dict[str, Any]:
+    """Navigate a session to a site and collect its basic DOM statistics."""
+    nav_command = NavigateCommand(
+        id=f"nav_{index}",
+        method="navigate",
+        session_id=session_id,
+        url=site_url,
+        wait_until=WaitCondition.LOAD,
+        timeout=5000
+    )
+    
+    nav_result = await manager.execute_navigate(nav_command)
+    if not nav_result.success:
+        return {"url": site_url, "status": "navigation_failed", "error": str(nav_result)}
+    
+    # Extract page title
+    title_command = ExtractCommand(
+        id=f"title_{index}",
+        method="extract",
+        session_id=session_id,
+        selector="title",
+        extract_type=ExtractType.TEXT
+    )
+    
+    # Extract all paragraphs
+    para_command = ExtractCommand(
+        id=f"para_{index}",
+        method="extract", 
+        session_id=session_id,
+        selector="p",
+        extract_type=ExtractType.TEXT,
+        multiple=True
+    )
+    
+    # Extract meta tags
+    meta_command = ExtractCommand(
+        id=f"meta_{index}",
+        method="extract",
+        session_id=session_id,
+        selector="meta[name]",
+        extract_type=ExtractType.ATTRIBUTE,
+        attribute_name="content", 
+        multiple=True
+    )
+    
+    # Fetch all three in a single page round-trip
+    title_result, para_result, meta_result = await manager.execute_extract_many(
+        [title_command, para_command, meta_command]
+    )
+    
+    return {
+        "url": site_url,
+        "status": "success",
+        "title": title_result.data if title_result.success else None,
+        "paragraphs_count": para_result.elements_found if para_result.success else 0,
+        "meta_tags_count": meta_result.elements_found if meta_result.success else 0,
+        "load_time_ms": nav_result.load_time_ms
+    }
 
 
 class TestM1DOMExtraction:
     """Test suite for M1 DOM extraction functionality."""
     
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
     async def browser_manager(self):
-        """Create browser manager for testing."""
+        """Create one browser manager shared by every test in the session."""
         manager = BrowserManager(headless=True)
         await manager.initialize()
         yield manager
         await manager.close()
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
+    def local_http(self):
+        """Serve the basic test page from a loopback HTTP server."""
+        with LocalPageServer() as page_server:
+            yield page_server.base_url
+    
+    @pytest_asyncio.fixture(loop_scope="session")
     async def browser_session(self, browser_manager):
-        """Create browser session for testing."""
+        """Create an isolated browser context on the shared browser for each test."""
         session_id = await browser_manager.create_session()
         yield session_id, browser_manager
         await browser_manager.close_session(session_id)
     
-    async def test_basic_dom_extraction(self, browser_session):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_basic_dom_extraction(self, browser_session, local_http):
         """Test basic DOM extraction from a simple webpage."""
         session_id, manager = browser_session
         
@@ -45,7 +120,7 @@ class TestM1DOMExtraction:
             id="nav_1",
             method="navigate",
             session_id=session_id,
-            url="https://example.com",
+            url=f"{local_http}/",
             wait_until=WaitCondition.LOAD
         )
         
@@ -71,16 +146,17 @@ class TestM1DOMExtraction:
         assert "<body" in extract_result.data.lower(), "DOM should contain body element"
         assert "<head" in extract_result.data.lower(), "DOM should contain head element"
     
-    async def test_structured_dom_as_json(self, browser_session):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_structured_dom_as_json(self, browser_session, local_http):
         """Test extraction of DOM elements as structured data."""
         session_id, manager = browser_session
         
-        # Navigate to example.com
+        # Navigate to the local test page
         nav_command = NavigateCommand(
             id="nav_2",
             method="navigate", 
             session_id=session_id,
-            url="https://example.com",
+            url=f"{local_http}/",
             wait_until=WaitCondition.LOAD
         )
         
@@ -124,18 +200,19 @@ class TestM1DOMExtraction:
         }
         
         # Verify JSON serializable
-        json_str = json.dumps(dom_structure)
-        assert len(json_str) > 0, "DOM structure should be JSON serializable"
+        json_bytes = orjson.dumps(dom_structure)
+        assert len(json_bytes) > 0, "DOM structure should be JSON serializable"
         
         # Verify structure
-        parsed = json.loads(json_str)
-        assert "headings" in parsed, "Should contain headings"
-        assert "links" in parsed, "Should contain links"
-        assert "element_info" in parsed, "Should contain element info"
+        assert "headings" in dom_structure, "Should contain headings"
+        assert "links" in dom_structure, "Should contain links"
+        assert "element_info" in dom_structure, "Should contain element info"
     
+    @pytest.mark.network
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_multiple_websites_dom_extraction(self, browser_session):
         """Test DOM extraction across multiple different websites."""
-        session_id, manager = browser_session
+        _, manager = browser_session
         
         test_sites = [
             "https://httpbin.org/html",
@@ -143,74 +220,29 @@ class TestM1DOMExtraction:
             "https://www.w3.org/",
         ]
         
-        results = []
-        
-        for site_url in test_sites:
-            try:
-                # Navigate to site
-                nav_command = NavigateCommand(
-                    id=f"nav_{len(results)}",
-                    method="navigate",
-                    session_id=session_id, 
-                    url=site_url,
-                    wait_until=WaitCondition.LOAD,
-                    timeout=15000
-                )
-                
-                nav_result = await manager.execute_navigate(nav_command)
-                if not nav_result.success:
-                    results.append({"url": site_url, "status": "navigation_failed", "error": str(nav_result)})
-                    continue
-                
-                # Extract page title
-                title_command = ExtractCommand(
-                    id=f"title_{len(results)}",
-                    method="extract",
-                    session_id=session_id,
-                    selector="title",
-                    extract_type=ExtractType.TEXT
-                )
-                
-                title_result = await manager.execute_extract(title_command)
-                
-                # Extract all paragraphs
-                para_command = ExtractCommand(
-                    id=f"para_{len(results)}",
-                    method="extract", 
-                    session_id=session_id,
-                    selector="p",
-                    extract_type=ExtractType.TEXT,
-                    multiple=True
-                )
-                
-                para_result = await manager.execute_extract(para_command)
-                
-                # Extract meta tags
-                meta_command = ExtractCommand(
-                    id=f"meta_{len(results)}",
-                    method="extract",
-                    session_id=session_id,
-                    selector="meta[name]",
-                    extract_type=ExtractType.ATTRIBUTE,
-                    attribute_name="content", 
-                    multiple=True
-                )
-                
-                meta_result = await manager.execute_extract(meta_command)
-                
-                site_data = {
-                    "url": site_url,
-                    "status": "success",
-                    "title": title_result.data if title_result.success else None,
-                    "paragraphs_count": para_result.elements_found if para_result.success else 0,
-                    "meta_tags_count": meta_result.elements_found if meta_result.success else 0,
-                    "load_time_ms": nav_result.load_time_ms
-                }
-                
-                results.append(site_data)
-                
-            except Exception as e:
-                results.append({"url": site_url, "status": "error", "error": str(e)})
+        # Probe every site concurrently, each in its own isolated session
+        site_sessions = await asyncio.gather(
+            *(manager.create_session() for _ in test_sites)
+        )
+        
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    _probe_site(manager, site_session, site_url, index)
+                    for index, (site_session, site_url) in enumerate(zip(site_sessions, test_sites))
+                ),
+                return_exceptions=True
+            )
+        finally:
+            await asyncio.gather(
+                *(manager.close_session(site_session) for site_session in site_sessions)
+            )
+        
+        results = [
+            {"url": site_url, "status": "error", "error": str(outcome)}
+            if isinstance(outcome, Exception) else outcome
+            for site_url, outcome in zip(test_sites, outcomes)
+        ]
         
         # Validate results
         assert len(results) == len(test_sites), "Should have results for all test sites"
@@ -226,6 +258,8 @@ class TestM1DOMExtraction:
                 assert "meta_tags_count" in result, "Should count meta tags"
                 assert "load_time_ms" in result, "Should track load time"
     
+    @pytest.mark.network
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_dom_extraction_performance(self, browser_session):
         """Test DOM extraction performance and response times."""
         session_id, manager = browser_session
@@ -249,35 +283,40 @@ class TestM1DOMExtraction:
             {"selector": "a", "type": ExtractType.ATTRIBUTE, "attr": "href", "name": "links", "multiple": True},
         ]
         
-        performance_results = []
-        
-        for test in extraction_tests:
-            start_time = time.time()
-            
-            command = ExtractCommand(
+        commands = [
+            ExtractCommand(
                 id=f"perf_{test['name']}",
                 method="extract",
                 session_id=session_id,
                 selector=test["selector"],
                 extract_type=test["type"],
+                attribute_name=test.get("attr"),
                 multiple=test.get("multiple", False)
             )
-            
-            if test["type"] == ExtractType.ATTRIBUTE:
-                command.attribute_name = test["attr"]
-            
+            for test in extraction_tests
+        ]
+        
+        async def timed_extract(command):
+            start_ns = time.perf_counter_ns()
             result = await manager.execute_extract(command)
-            
-            end_time = time.time()
-            execution_time = (end_time - start_time) * 1000  # Convert to ms
-            
-            performance_results.append({
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6  # Convert to ms
+            return result, execution_time
+        
+        # Extractions target the same loaded page, so run them concurrently
+        timed_results = await asyncio.gather(
+            *(timed_extract(command) for command in commands)
+        )
+        
+        performance_results = [
+            {
                 "test_name": test["name"],
                 "execution_time_ms": execution_time,
                 "success": result.success,
                 "elements_found": result.elements_found if result.success else 0,
                 "data_size": len(str(result.data)) if result.success else 0
-            })
+            }
+            for test, (result, execution_time) in zip(extraction_tests, timed_results)
+        ]
         
         # Validate performance
         for perf in performance_results:
@@ -285,7 +324,8 @@ class TestM1DOMExtraction:
             assert perf["execution_time_ms"] < 5000, f"Extraction {perf['test_name']} took too long: {perf['execution_time_ms']}ms"
             assert perf["elements_found"] >= 0, f"Should find valid element count for {perf['test_name']}"
     
-    async def test_dom_extraction_error_handling(self, browser_session):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_dom_extraction_error_handling(self, browser_session, local_http):
         """Test DOM extraction error handling."""
         session_id, manager = browser_session
         
@@ -294,7 +334,7 @@ class TestM1DOMExtraction:
             id="error_nav",
             method="navigate", 
             session_id=session_id,
-            url="https://example.com",
+            url=f"{local_http}/",
             wait_until=WaitCondition.LOAD
         )
         
@@ -346,6 +386,8 @@ async def run_m1_validation():
     
     # Run tests
     test_instance = TestM1DOMExtraction()
+    page_server = LocalPageServer().start()
+    local_http = page_server.base_url
     
     try:
         # Create browser manager
@@ -360,7 +402,7 @@ async def run_m1_validation():
         # Run basic DOM extraction test
         print("\n📋 Testing basic DOM extraction...")
         try:
-            await test_instance.test_basic_dom_extraction((session_id, manager))
+            await test_instance.test_basic_dom_extraction((session_id, manager), local_http)
             print("✅ Basic DOM extraction: PASS")
         except Exception as e:
             print(f"❌ Basic DOM extraction: FAIL - {e}")
@@ -368,7 +410,7 @@ async def run_m1_validation():
         # Run structured DOM test 
         print("\n📋 Testing structured DOM as JSON...")
         try:
-            await test_instance.test_structured_dom_as_json((session_id, manager))
+            await test_instance.test_structured_dom_as_json((session_id, manager), local_http)
             print("✅ Structured DOM as JSON: PASS")
         except Exception as e:
             print(f"❌ Structured DOM as JSON: FAIL - {e}")
@@ -392,7 +434,7 @@ async def run_m1_validation():
         # Run error handling test
         print("\n📋 Testing error handling...")
         try:
-            await test_instance.test_dom_extraction_error_handling((session_id, manager))
+            await test_instance.test_dom_extraction_error_handling((session_id, manager), local_http)
             print("✅ DOM extraction error handling: PASS")
         except Exception as e:
             print(f"❌ DOM extraction error handling: FAIL - {e}")
@@ -408,7 +450,10 @@ async def run_m1_validation():
         print(f"❌ Critical error during M1 validation: {e}")
         if 'manager' in locals():
             await manager.close()
+    
+    finally:
+        page_server.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(run_m1_validation())
\ No newline at end of file
+    fast_loop.run(run_m1_validation())
\ No newline at end of file
@@ -7,12 +7,16 @@ for the AUX protocol, testing all components end-to-end.
 """
 
 import asyncio
-import json
 import logging
+import os
+import orjson
 import tempfile
 import time
 from pathlib import Path
 import sys
+from operator import attrgetter
+from typing import Any, Dict, List, NamedTuple
+import yaml
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -23,6 +27,53 @@ from aux.testing import (
 )
 # Using standard logging for tests
 
+# Write scenario files with libyaml when PyYAML was built against it
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+M4_SERVER_URL = "ws://localhost:8765"  # Will be mocked for unit tests
+
+# Scratch files are written and read straight back, so keep them on the
+# RAM-backed tmpfs where one exists; None falls back to the system default
+M4_TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def _checks(*pairs):
+    """Precompile (dotted path, expected value) pairs into attrgetter checks."""
+    return tuple((attrgetter(path), path, expected) for path, expected in pairs)
+
+
+# Expected attribute values checked by _expect
+AGENT_CHECKS = _checks(
+    ("agent_id", "test_agent_001"),
+    ("server_url", M4_SERVER_URL),
+    ("behavior.add_natural_delays", True),
+    ("state.value", "idle"),
+)
+LOADED_SCENARIO_CHECKS = _checks(
+    ("name", "Test Scenario"),
+    ("description", "A test scenario for validation"),
+)
+HARNESS_CHECKS = _checks(
+    ("config.server_url", M4_SERVER_URL),
+    ("config.max_parallel_agents", 2),
+    ("running", False),
+)
+
+
+def _expect(obj: Any, checks) -> None:
+    """Assert each checked attribute of ``obj`` equals its expected value."""
+    for getter, path, expected in checks:
+        actual = getter(obj)
+        assert actual == expected, f"{path}: expected {expected!r}, got {actual!r}"
+
+
+class MockScenario(NamedTuple):
+    """Minimal stand-in for a TestScenario when exercising tag filtering."""
+    
+    name: str
+    tags: List[str]
+    steps: List[Dict[str, Any]]
+
 
 class M4IntegrationTest:
     """Comprehensive M4 testing suite."""
@@ -30,11 +81,13 @@ class M4IntegrationTest:
     def __init__(self):
         """Initialize the test suite."""
         self.logger = self._setup_logging()
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="aux_m4_test_"))
-        self.server_url = "ws://localhost:8765"  # Will be mocked for unit tests
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="aux_m4_test_", dir=M4_TEMP_ROOT))
+        self.server_url = M4_SERVER_URL
+        # Loading scenarios is stateless, so every test shares one runner
+        self.runner = ScenarioRunner(self.server_url, logger=self.logger)
         
-        self.logger.info(f"M4 Integration Test initialized")
-        self.logger.info(f"Temp directory: {self.temp_dir}")
+        self.logger.info("M4 Integration Test initialized")
+        self.logger.info("Temp directory: %s", self.temp_dir)
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the test."""
@@ -54,7 +107,8 @@ class M4IntegrationTest:
             behavior = AgentBehavior(
                 thinking_delay_range=(0.1, 0.3),
                 add_natural_delays=True,
-                validate_responses=True
+                validate_responses=True,
+                fast_forward=True
             )
             
             agent = MockAgent(
@@ -65,15 +119,11 @@ class M4IntegrationTest:
             )
             
             # Verify agent properties
-            assert agent.agent_id == "test_agent_001"
-            assert agent.server_url == self.server_url
-            assert agent.behavior.add_natural_delays == True
-            assert agent.state.value == "idle"
+            _expect(agent, AGENT_CHECKS)
             
-            # Test behavior simulation methods
-            start_time = time.time()
-            await agent.simulate_thinking("test context")
-            think_time = time.time() - start_time
+            # Test behavior simulation methods; fast-forwarding skips the
+            # sleep but still reports the simulated delay
+            think_time = await agent.simulate_thinking("test context")
             
             # Should have some delay (though minimal for testing)
             assert 0.05 <= think_time <= 0.5  # Allow some variance
@@ -96,7 +146,7 @@ class M4IntegrationTest:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ MockAgent creation test failed: {e}")
+            self.logger.error("❌ MockAgent creation test failed: %s", e)
             return False
     
     def test_scenario_loading(self) -> bool:
@@ -129,21 +179,14 @@ class M4IntegrationTest:
             
             # Save test scenario
             scenario_file = self.temp_dir / "test_scenario.yaml"
-            import yaml
             with open(scenario_file, 'w') as f:
-                yaml.dump(scenario_data, f)
+                yaml.dump(scenario_data, f, Dumper=YAML_DUMPER)
             
             # Test scenario loading
-            runner = ScenarioRunner(
-                self.server_url,
-                logger=self.logger
-            )
-            
-            scenario = runner.load_scenario_file(scenario_file)
+            scenario = self.runner.load_scenario_file(scenario_file)
             
             # Verify scenario properties
-            assert scenario.name == "Test Scenario"
-            assert scenario.description == "A test scenario for validation"
+            _expect(scenario, LOADED_SCENARIO_CHECKS)
             assert len(scenario.steps) == 1
             assert scenario.steps[0].name == "Test step 1"
             assert scenario.steps[0].command["method"] == "navigate"
@@ -152,7 +195,7 @@ class M4IntegrationTest:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Scenario loading test failed: {e}")
+            self.logger.error("❌ Scenario loading test failed: %s", e)
             return False
     
     async def test_test_harness_functionality(self) -> bool:
@@ -173,27 +216,13 @@ class M4IntegrationTest:
             harness = TestHarness(config, self.logger)
             
             # Verify harness initialization
-            assert harness.config.server_url == self.server_url
-            assert harness.config.max_parallel_agents == 2
-            assert not harness.running
+            _expect(harness, HARNESS_CHECKS)
             
             # Test scenario filtering
             scenarios = [
-                type('MockScenario', (), {
-                    'name': 'Scenario 1',
-                    'tags': ['smoke', 'basic'],
-                    'steps': []
-                })(),
-                type('MockScenario', (), {
-                    'name': 'Scenario 2', 
-                    'tags': ['integration'],
-                    'steps': []
-                })(),
-                type('MockScenario', (), {
-                    'name': 'Scenario 3',
-                    'tags': ['smoke', 'advanced'],
-                    'steps': []
-                })()
+                MockScenario('Scenario 1', ['smoke', 'basic'], []),
+                MockScenario('Scenario 2', ['integration'], []),
+                MockScenario('Scenario 3', ['smoke', 'advanced'], [])
             ]
             
             # Test tag filtering
@@ -211,7 +240,7 @@ class M4IntegrationTest:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ TestHarness functionality test failed: {e}")
+            self.logger.error("❌ TestHarness functionality test failed: %s", e)
             return False
     
     async def test_reporting_system(self) -> bool:
@@ -287,8 +316,7 @@ class M4IntegrationTest:
             
             # Verify JSON file was created and has correct content
             assert json_file.exists()
-            with open(json_file) as f:
-                metrics_data = json.load(f)
+            metrics_data = orjson.loads(json_file.read_bytes())
             
             assert metrics_data["summary"]["total_scenarios"] == 1
             assert metrics_data["summary"]["success_rate"] == 1.0
@@ -307,7 +335,7 @@ class M4IntegrationTest:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Reporting system test failed: {e}")
+            self.logger.error("❌ Reporting system test failed: %s", e)
             return False
     
     def test_cli_validation(self) -> bool:
@@ -334,13 +362,11 @@ class M4IntegrationTest:
             }
             
             valid_file = self.temp_dir / "valid_scenario.yaml"
-            import yaml
             with open(valid_file, 'w') as f:
-                yaml.dump(valid_scenario, f)
+                yaml.dump(valid_scenario, f, Dumper=YAML_DUMPER)
             
             # Test scenario loading (validates format)
-            runner = ScenarioRunner(self.server_url, logger=self.logger)
-            scenario = runner.load_scenario_file(valid_file)
+            scenario = self.runner.load_scenario_file(valid_file)
             assert scenario.name == "Valid Test"
             
             # Create invalid scenario
@@ -351,11 +377,11 @@ class M4IntegrationTest:
             
             invalid_file = self.temp_dir / "invalid_scenario.yaml"
             with open(invalid_file, 'w') as f:
-                yaml.dump(invalid_scenario, f)
+                yaml.dump(invalid_scenario, f, Dumper=YAML_DUMPER)
             
             # Test that invalid scenario fails validation
             try:
-                runner.load_scenario_file(invalid_file)
+                self.runner.load_scenario_file(invalid_file)
                 assert False, "Should have failed validation"
             except ValueError:
                 pass  # Expected
@@ -364,10 +390,10 @@ class M4IntegrationTest:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ CLI validation test failed: {e}")
+            self.logger.error("❌ CLI validation test failed: %s", e)
             return False
     
-    def test_scenario_files(self) -> bool:
+    async def test_scenario_files(self) -> bool:
         """Test that all created scenario files are valid."""
         self.logger.info("Testing scenario file validity...")
         
@@ -378,36 +404,43 @@ class M4IntegrationTest:
                 self.logger.warning("Scenarios directory not found, skipping test")
                 return True
             
-            runner = ScenarioRunner(self.server_url, logger=self.logger)
-            valid_count = 0
+            def validate_scenario_file(scenario_file: Path) -> None:
+                scenario = self.runner.load_scenario_file(scenario_file)
+                
+                # Basic validation checks
+                assert scenario.name, f"Scenario {scenario_file.name} missing name"
+                assert scenario.description, f"Scenario {scenario_file.name} missing description"
+                assert scenario.steps, f"Scenario {scenario_file.name} has no steps"
+                
+                # Validate each step
+                for i, step in enumerate(scenario.steps):
+                    assert step.name, f"Step {i+1} in {scenario_file.name} missing name"
+                    assert step.command, f"Step {i+1} in {scenario_file.name} missing command"
+                    assert "method" in step.command, f"Step {i+1} in {scenario_file.name} missing method"
+            
+            # Files are independent, so load them side by side on the
+            # default thread pool
+            scenario_files = list(scenarios_dir.glob("*.yaml"))
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *(loop.run_in_executor(None, validate_scenario_file, scenario_file)
+                  for scenario_file in scenario_files),
+                return_exceptions=True
+            )
             
-            for scenario_file in scenarios_dir.glob("*.yaml"):
-                try:
-                    scenario = runner.load_scenario_file(scenario_file)
-                    
-                    # Basic validation checks
-                    assert scenario.name, f"Scenario {scenario_file.name} missing name"
-                    assert scenario.description, f"Scenario {scenario_file.name} missing description"
-                    assert scenario.steps, f"Scenario {scenario_file.name} has no steps"
-                    
-                    # Validate each step
-                    for i, step in enumerate(scenario.steps):
-                        assert step.name, f"Step {i+1} in {scenario_file.name} missing name"
-                        assert step.command, f"Step {i+1} in {scenario_file.name} missing command"
-                        assert "method" in step.command, f"Step {i+1} in {scenario_file.name} missing method"
-                    
-                    valid_count += 1
-                    self.logger.debug(f"✅ Validated scenario: {scenario_file.name}")
-                    
-                except Exception as e:
-                    self.logger.error(f"❌ Invalid scenario {scenario_file.name}: {e}")
+            valid_count = 0
+            for scenario_file, result in zip(scenario_files, results):
+                if isinstance(result, Exception):
+                    self.logger.error("❌ Invalid scenario %s: %s", scenario_file.name, result)
                     return False
+                valid_count += 1
+                self.logger.debug("✅ Validated scenario: %s", scenario_file.name)
             
-            self.logger.info(f"✅ All {valid_count} scenario files are valid")
+            self.logger.info("✅ All %s scenario files are valid", valid_count)
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Scenario file validation failed: {e}")
+            self.logger.error("❌ Scenario file validation failed: %s", e)
             return False
     
     async def run_all_tests(self) -> bool:
@@ -415,66 +448,79 @@ class M4IntegrationTest:
         self.logger.info("🚀 Starting M4 Integration Test Suite")
         
         tests = [
-            ("MockAgent Creation", self.test_mock_agent_creation()),
-            ("Scenario Loading", self.test_scenario_loading()),
-            ("TestHarness Functionality", self.test_test_harness_functionality()),
-            ("Reporting System", self.test_reporting_system()),
-            ("CLI Validation", self.test_cli_validation()),
-            ("Scenario Files", self.test_scenario_files())
+            ("MockAgent Creation", self.test_mock_agent_creation),
+            ("Scenario Loading", self.test_scenario_loading),
+            ("TestHarness Functionality", self.test_test_harness_functionality),
+            ("Reporting System", self.test_reporting_system),
+            ("CLI Validation", self.test_cli_validation),
+            ("Scenario Files", self.test_scenario_files)
         ]
         
+        # The tests share no state and write distinct files, so run them
+        # together; synchronous ones go to the default thread pool
+        loop = asyncio.get_running_loop()
+        
+        async def run_test(test_func):
+            if asyncio.iscoroutinefunction(test_func):
+                return await test_func()
+            return await loop.run_in_executor(None, test_func)
+        
+        self.logger.info("\n🧪 Running %s tests concurrently", len(tests))
+        results = await asyncio.gather(
+            *(run_test(test_func) for _, test_func in tests),
+            return_exceptions=True
+        )
+        
         passed = 0
         failed = 0
         
-        for test_name, test_coro in tests:
-            self.logger.info(f"\n🧪 Running test: {test_name}")
-            try:
-                if asyncio.iscoroutine(test_coro):
-                    result = await test_coro
-                else:
-                    result = test_coro
-                
-                if result:
-                    passed += 1
-                    self.logger.info(f"✅ {test_name} PASSED")
-                else:
-                    failed += 1
-                    self.logger.error(f"❌ {test_name} FAILED")
-                    
-            except Exception as e:
+        for (test_name, _), result in zip(tests, results):
+            if isinstance(result, Exception):
+                failed += 1
+                self.logger.error("💥 %s CRASHED: %s", test_name, result)
+            elif result:
+                passed += 1
+                self.logger.info("✅ %s PASSED", test_name)
+            else:
                 failed += 1
-                self.logger.error(f"💥 {test_name} CRASHED: {e}")
+                self.logger.error("❌ %s FAILED", test_name)
         
         # Summary
         total = passed + failed
         success_rate = passed / total if total > 0 else 0
         
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info(f"M4 INTEGRATION TEST SUMMARY")
-        self.logger.info(f"{'='*60}")
-        self.logger.info(f"Total Tests: {total}")
-        self.logger.info(f"Passed: {passed}")
-        self.logger.info(f"Failed: {failed}")
-        self.logger.info(f"Success Rate: {success_rate:.1%}")
+        self.logger.info("\n%s", "=" * 60)
+        self.logger.info("M4 INTEGRATION TEST SUMMARY")
+        self.logger.info("=" * 60)
+        self.logger.info("Total Tests: %s", total)
+        self.logger.info("Passed: %s", passed)
+        self.logger.info("Failed: %s", failed)
+        self.logger.info("Success Rate: %.1f%%", success_rate * 100)
         
         if failed == 0:
             self.logger.info("🎉 ALL TESTS PASSED! M4 implementation is ready.")
         else:
-            self.logger.error(f"💥 {failed} tests failed. Please fix issues before proceeding.")
+            self.logger.error("💥 %s tests failed. Please fix issues before proceeding.", failed)
         
         # Cleanup
         try:
             import shutil
             shutil.rmtree(self.temp_dir)
-            self.logger.debug(f"Cleaned up temp directory: {self.temp_dir}")
+            self.logger.debug("Cleaned up temp directory: %s", self.temp_dir)
         except Exception as e:
-            self.logger.warning(f"Failed to cleanup temp directory: {e}")
+            self.logger.warning("Failed to cleanup temp directory: %s", e)
         
         return failed == 0
 
 
 async def main():
     """Main entry point for M4 integration testing."""
+    # The log format never shows thread or process details, so skip
+    # collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     test_suite = M4IntegrationTest()
     success = await test_suite.run_all_tests()
     
@@ -7,36 +7,157 @@ various commands to test the routing and response functionality.
 """
 
 import asyncio
-import json
+import os
+import orjson
 import websockets
-import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from tests import fast_loop
+
+
+DEFAULT_URI = "ws://localhost:8080"
+
+# Static command bodies; each test copies one and adds a fresh ID
+_NAVIGATE_TEMPLATE = {
+    "method": "navigate",
+    "url": "https://example.com",
+    "wait_until": "load"
+}
+_CLICK_TEMPLATE = {
+    "method": "click",
+    "selector": "button.submit",
+    "button": "left",
+    "click_count": 1
+}
+_FILL_TEMPLATE = {
+    "method": "fill",
+    "selector": "input[name='username']",
+    "text": "test_user",
+    "clear_first": True
+}
+_EXTRACT_TEMPLATE = {
+    "method": "extract",
+    "selector": "h1",
+    "extract_type": "text",
+    "multiple": False
+}
+_WAIT_TEMPLATE = {
+    "method": "wait",
+    "selector": ".loading",
+    "condition": "hidden",
+    "timeout": 5000
+}
+_INVALID_TEMPLATE = {
+    "method": "invalid_method",
+    "some_param": "value"
+}
+
+
+def _new_id() -> str:
+    """Return a random 32-character hex ID for a command or session."""
+    return os.urandom(16).hex()
+
+
+def _pretty(data: Dict[str, Any]) -> str:
+    """Format a message with two-space indentation for console output."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def _print_exchange(title: Optional[str], sent: str, response: Dict[str, Any]) -> None:
+    """Print a request and its response together as one block of output."""
+    if title:
+        print(f"\n=== Testing {title} ===")
+    print(f"Sending: {sent}")
+    print(f"Received: {_pretty(response)}")
 
 
 class AUXTestClient:
     """Simple test client for AUX Protocol WebSocket server."""
     
-    def __init__(self, uri: str = "ws://localhost:8080"):
+    def __init__(self, uri: str = DEFAULT_URI):
         self.uri = uri
         self.websocket = None
-        self.session_id = str(uuid.uuid4())
+        self.session_id = _new_id()
+        # Responses still owed by the server, keyed by request ID in send order
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
         
     async def connect(self):
         """Connect to the WebSocket server."""
         print(f"Connecting to {self.uri}...")
         self.websocket = await websockets.connect(self.uri)
+        self._reader_task = asyncio.create_task(self._read_responses())
         print("Connected successfully!")
         
     async def disconnect(self):
         """Disconnect from the WebSocket server."""
         if self.websocket:
             await self.websocket.close()
+            if self._reader_task:
+                await self._reader_task
+                self._reader_task = None
             print("Disconnected.")
             
+    async def __aenter__(self) -> "AUXTestClient":
+        """Connect on entry so the block receives a ready client."""
+        await self.connect()
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Disconnect on exit, whether or not the block raised."""
+        await self.disconnect()
+            
+    async def _read_responses(self):
+        """
+        Resolve pending requests as responses arrive.
+        
+        The server answers each connection's messages in order, so a response
+        without a known ID (such as a parse error) belongs to the oldest
+        pending request.
+        """
+        try:
+            async for message in self.websocket:
+                response = orjson.loads(message)
+                future = self._pending.pop(response.get("id"), None)
+                if future is None and self._pending:
+                    future = self._pending.pop(next(iter(self._pending)))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("Connection closed before response"))
+            self._pending.clear()
+            
+    async def _request(self, message: str, request_id: str) -> Dict[str, Any]:
+        """
+        Send a raw message and wait for its response.
+        
+        Args:
+            message: Message text to send
+            request_id: ID the response is matched on
+            
+        Returns:
+            Response dictionary
+        """
+        if not self.websocket:
+            raise RuntimeError("Not connected to server")
+            
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        await self.websocket.send(message)
+        return await future
+            
     async def send_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send a command and wait for response.
         
+        Several commands may be in flight at once on the same connection;
+        each call returns the response carrying its command ID. A command
+        without an ID is given one, so its response can be matched.
+        
         Args:
             command: Command dictionary
             
@@ -46,232 +167,116 @@ class AUXTestClient:
         if not self.websocket:
             raise RuntimeError("Not connected to server")
             
-        # Add session_id if not present
+        # Add session_id and id if not present
         if "session_id" not in command:
             command["session_id"] = self.session_id
+        if not command.get("id"):
+            command["id"] = _new_id()
             
         # Send command
-        command_json = json.dumps(command)
-        print(f"Sending: {command_json}")
-        await self.websocket.send(command_json)
+        command_json = orjson.dumps(command).decode()
+        return await self._request(command_json, command["id"])
         
-        # Wait for response
-        response_json = await self.websocket.recv()
-        response = json.loads(response_json)
-        
-        print(f"Received: {json.dumps(response, indent=2)}")
+    async def _run_command_test(self, title: str, command: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a test command and print it with its response once it arrives."""
+        response = await self.send_command(command)
+        _print_exchange(title, orjson.dumps(command).decode(), response)
         return response
         
     async def test_navigate(self):
         """Test navigate command."""
-        print("\n=== Testing NAVIGATE command ===")
-        command = {
-            "id": str(uuid.uuid4()),
-            "method": "navigate",
-            "url": "https://example.com",
-            "wait_until": "load"
-        }
-        return await self.send_command(command)
+        command = dict(_NAVIGATE_TEMPLATE, id=_new_id())
+        return await self._run_command_test("NAVIGATE command", command)
         
     async def test_click(self):
         """Test click command."""
-        print("\n=== Testing CLICK command ===")
-        command = {
-            "id": str(uuid.uuid4()),
-            "method": "click",
-            "selector": "button.submit",
-            "button": "left",
-            "click_count": 1
-        }
-        return await self.send_command(command)
+        command = dict(_CLICK_TEMPLATE, id=_new_id())
+        return await self._run_command_test("CLICK command", command)
         
     async def test_fill(self):
         """Test fill command."""
-        print("\n=== Testing FILL command ===")
-        command = {
-            "id": str(uuid.uuid4()),
-            "method": "fill",
-            "selector": "input[name='username']",
-            "text": "test_user",
-            "clear_first": True
-        }
-        return await self.send_command(command)
+        command = dict(_FILL_TEMPLATE, id=_new_id())
+        return await self._run_command_test("FILL command", command)
         
     async def test_extract(self):
         """Test extract command."""
-        print("\n=== Testing EXTRACT command ===")
-        command = {
-            "id": str(uuid.uuid4()),
-            "method": "extract",
-            "selector": "h1",
-            "extract_type": "text",
-            "multiple": False
-        }
-        return await self.send_command(command)
+        command = dict(_EXTRACT_TEMPLATE, id=_new_id())
+        return await self._run_command_test("EXTRACT command", command)
         
     async def test_wait(self):
         """Test wait command."""
-        print("\n=== Testing WAIT command ===")
-        command = {
-            "id": str(uuid.uuid4()),
-            "method": "wait",
-            "selector": ".loading",
-            "condition": "hidden",
-            "timeout": 5000
-        }
-        return await self.send_command(command)
+        command = dict(_WAIT_TEMPLATE, id=_new_id())
+        return await self._run_command_test("WAIT command", command)
         
     async def test_invalid_command(self):
         """Test invalid command handling."""
-        print("\n=== Testing INVALID command ===")
-        command = {
-            "id": str(uuid.uuid4()),
-            "method": "invalid_method",
-            "some_param": "value"
-        }
-        return await self.send_command(command)
+        command = dict(_INVALID_TEMPLATE, id=_new_id())
+        return await self._run_command_test("INVALID command", command)
         
     async def test_malformed_json(self):
         """Test malformed JSON handling."""
-        print("\n=== Testing malformed JSON ===")
-        if not self.websocket:
-            raise RuntimeError("Not connected to server")
-            
         malformed_json = '{"id": "test", "method": "navigate", "url": "https://example.com"'
-        print(f"Sending malformed JSON: {malformed_json}")
-        await self.websocket.send(malformed_json)
-        
-        response_json = await self.websocket.recv()
-        response = json.loads(response_json)
-        print(f"Received: {json.dumps(response, indent=2)}")
+        response = await self._request(malformed_json, _new_id())
+        _print_exchange("malformed JSON", malformed_json, response)
         return response
 
 
-async def run_tests():
-    """Run all test cases."""
-    client = AUXTestClient()
-    
-    try:
-        await client.connect()
-        
-        # Test all commands
-        await client.test_navigate()
-        await client.test_click()
-        await client.test_fill()
-        await client.test_extract()
-        await client.test_wait()
-        
-        # Test error handling
-        await client.test_invalid_command()
-        await client.test_malformed_json()
-        
-        print("\n=== All tests completed ===")
-        
-    except Exception as e:
-        print(f"Test error: {e}")
-    finally:
-        await client.disconnect()
-
-
-async def run_tests_with_uri(uri: str):
-    """Run all test cases with custom URI."""
-    client = AUXTestClient(uri)
-    
+async def run_tests(uri: str = DEFAULT_URI):
+    """Run all test cases against the server at ``uri``."""
     try:
-        await client.connect()
-        
-        # Test all commands
-        await client.test_navigate()
-        await client.test_click()
-        await client.test_fill()
-        await client.test_extract()
-        await client.test_wait()
-        
-        # Test error handling
-        await client.test_invalid_command()
-        await client.test_malformed_json()
-        
-        print("\n=== All tests completed ===")
-        
+        async with AUXTestClient(uri) as client:
+            # Pipeline every test over the one connection; the server still
+            # handles them in send order, and each test prints its header,
+            # command and response together once the response arrives
+            await asyncio.gather(
+                client.test_navigate(),
+                client.test_click(),
+                client.test_fill(),
+                client.test_extract(),
+                client.test_wait(),
+                # Test error handling
+                client.test_invalid_command(),
+                client.test_malformed_json(),
+            )
+            
+            print("\n=== All tests completed ===")
+            
     except Exception as e:
         print(f"Test error: {e}")
-    finally:
-        await client.disconnect()
 
 
-async def interactive_mode():
-    """Run in interactive mode for manual testing."""
-    client = AUXTestClient()
-    
+async def interactive_mode(uri: str = DEFAULT_URI):
+    """Run in interactive mode for manual testing against the server at ``uri``."""
     try:
-        await client.connect()
-        
-        print("\nInteractive mode - Enter commands as JSON:")
-        print("Example: {\"id\": \"1\", \"method\": \"navigate\", \"url\": \"https://example.com\"}")
-        print("Type 'quit' to exit\n")
-        
-        while True:
-            try:
-                user_input = input("Command: ").strip()
-                
-                if user_input.lower() in ['quit', 'exit', 'q']:
-                    break
+        async with AUXTestClient(uri) as client:
+            print(f"\nInteractive mode connected to {uri}")
+            print("Enter commands as JSON:")
+            print("Example: {\"id\": \"1\", \"method\": \"navigate\", \"url\": \"https://example.com\"}")
+            print("Type 'quit' to exit\n")
+            
+            while True:
+                try:
+                    user_input = input("Command: ").strip()
                     
-                if not user_input:
-                    continue
+                    if user_input.lower() in ['quit', 'exit', 'q']:
+                        break
+                        
+                    if not user_input:
+                        continue
+                        
+                    command = orjson.loads(user_input)
+                    response = await client.send_command(command)
+                    _print_exchange(None, orjson.dumps(command).decode(), response)
                     
-                command = json.loads(user_input)
-                await client.send_command(command)
-                
-            except json.JSONDecodeError:
-                print("Invalid JSON format")
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                print(f"Error: {e}")
-                
-    except Exception as e:
-        print(f"Interactive mode error: {e}")
-    finally:
-        await client.disconnect()
-
-
-async def interactive_mode_with_uri(uri: str):
-    """Run in interactive mode with custom URI."""
-    client = AUXTestClient(uri)
-    
-    try:
-        await client.connect()
-        
-        print(f"\nInteractive mode connected to {uri}")
-        print("Enter commands as JSON:")
-        print("Example: {\"id\": \"1\", \"method\": \"navigate\", \"url\": \"https://example.com\"}")
-        print("Type 'quit' to exit\n")
-        
-        while True:
-            try:
-                user_input = input("Command: ").strip()
-                
-                if user_input.lower() in ['quit', 'exit', 'q']:
+                except orjson.JSONDecodeError:
+                    print("Invalid JSON format")
+                except KeyboardInterrupt:
                     break
+                except Exception as e:
+                    print(f"Error: {e}")
                     
-                if not user_input:
-                    continue
-                    
-                command = json.loads(user_input)
-                await client.send_command(command)
-                
-            except json.JSONDecodeError:
-                print("Invalid JSON format")
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                print(f"Error: {e}")
-                
     except Exception as e:
         print(f"Interactive mode error: {e}")
-    finally:
-        await client.disconnect()
 
 
 def main():
@@ -279,8 +284,8 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="AUX Protocol WebSocket Test Client")
-    parser.add_argument("--uri", default="ws://localhost:8080", 
-                       help="WebSocket server URI (default: ws://localhost:8080)")
+    parser.add_argument("--uri", default=DEFAULT_URI, 
+                       help=f"WebSocket server URI (default: {DEFAULT_URI})")
     parser.add_argument("--interactive", "-i", action="store_true",
                        help="Run in interactive mode")
     
@@ -288,10 +293,10 @@ def main():
     
     if args.interactive:
         print("Starting AUX Protocol WebSocket Test Client (Interactive Mode)")
-        asyncio.run(interactive_mode_with_uri(args.uri))
+        fast_loop.run(interactive_mode(args.uri))
     else:
         print("Starting AUX Protocol WebSocket Test Client (Automated Tests)")
-        asyncio.run(run_tests_with_uri(args.uri))
+        fast_loop.run(run_tests(args.uri))
 
 
 if __name__ == "__main__":
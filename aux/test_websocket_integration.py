@@ -7,17 +7,19 @@ and the Browser Manager to ensure end-to-end functionality.
 """
 
 import asyncio
-import json
 import logging
+import orjson
 import sys
 import websockets
 from pathlib import Path
+from typing import Any, Dict, List
 
 # Add the src directory to the path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from aux.server.websocket_server import WebSocketServer
 from aux.browser.manager import BrowserManager
+from tests import fast_loop
 
 # Configure logging
 logging.basicConfig(
@@ -27,37 +29,69 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def test_websocket_integration():
-    """Test WebSocket server integration with browser manager."""
-    print("🚀 Starting WebSocket Integration Test")
+def _dumps(message: dict) -> str:
+    """Encode a command as a JSON text frame."""
+    return orjson.dumps(message).decode()
+
+
+_loads = orjson.loads
+
+
+async def _pipeline(websocket, frames: List[str]) -> List[Dict[str, Any]]:
+    """
+    Send frames back to back, then collect one response per frame.
     
-    # Create browser manager with test settings
-    browser_manager = BrowserManager(headless=True, timeout_ms=10000)
+    The server answers a connection's messages in order and websockets
+    preserves frame order, so responses line up with ``frames``.
+    """
+    for frame in frames:
+        await websocket.send(frame)
+    return [_loads(await websocket.recv()) for _ in frames]
+
+
+async def _wait_ready(host: str, port: int, timeout: float = 2.0) -> None:
+    """
+    Wait until a TCP listener accepts connections on ``host``:``port``.
     
-    # Create WebSocket server with browser manager
-    server = WebSocketServer(
-        host="localhost",
-        port=8081,  # Use different port for testing
-        browser_manager=browser_manager
-    )
+    Raises:
+        TimeoutError: If nothing accepts a connection within ``timeout`` seconds
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            if loop.time() >= deadline:
+                raise TimeoutError(f"Server on {host}:{port} not ready after {timeout}s")
+            await asyncio.sleep(0.005)
+        else:
+            writer.close()
+            return
+
+
+# Server shared by both test coroutines; a dedicated port keeps it clear of
+# a locally running default server
+TEST_HOST = "localhost"
+TEST_PORT = 8081
+TEST_SERVER_URL = f"ws://{TEST_HOST}:{TEST_PORT}"
+
+# Loopback test clients: skip per-message deflate, which only costs CPU for
+# short JSON commands, and the incoming-frame queue limit
+CLIENT_CONNECT_OPTIONS = {"max_queue": None, "compression": None}
+
+
+async def test_websocket_integration(browser_manager: BrowserManager) -> bool:
+    """Test WebSocket server integration with browser manager."""
+    print("🚀 Starting WebSocket Integration Test")
     
     try:
-        # Start the server
-        print("\n🌐 Starting WebSocket server...")
-        await server.start()
-        print("✅ WebSocket server started")
-        
-        # Give server a moment to fully start
-        await asyncio.sleep(1)
-        
         # Test client connection and commands
         print("\n🔌 Testing client connection...")
         
-        async with websockets.connect("ws://localhost:8081") as websocket:
+        async with websockets.connect(TEST_SERVER_URL, **CLIENT_CONNECT_OPTIONS) as websocket:
             print("✅ Connected to WebSocket server")
             
-            # Test navigation command
-            print("\n🌐 Testing navigation command...")
             nav_command = {
                 "id": "test-nav-1",
                 "method": "navigate",
@@ -65,10 +99,32 @@ async def test_websocket_integration():
                 "url": "https://example.com",
                 "wait_until": "load"
             }
+            extract_command = {
+                "id": "test-extract-1", 
+                "method": "extract",
+                "session_id": "test-session",
+                "selector": "h1",
+                "extract_type": "text"
+            }
+            wait_command = {
+                "id": "test-wait-1",
+                "method": "wait", 
+                "session_id": "test-session",
+                "condition": "load",
+                "timeout": 5000
+            }
+            commands = [nav_command, extract_command, wait_command]
             
-            await websocket.send(json.dumps(nav_command))
-            response = await websocket.recv()
-            nav_result = json.loads(response)
+            # Pipeline the commands back to back; the server handles a
+            # connection's messages in order, so they still run in sequence
+            # but only the first pays a full round trip
+            print("\n📨 Sending navigation, extraction and wait commands...")
+            responses = await _pipeline(websocket, [_dumps(command) for command in commands])
+            results = {response.get("id"): response for response in responses}
+            
+            # Test navigation command
+            print("\n🌐 Testing navigation command...")
+            nav_result = results.get(nav_command["id"], {})
             
             if nav_result.get("success"):
                 print(f"✅ Navigation successful: {nav_result.get('url')}")
@@ -78,17 +134,7 @@ async def test_websocket_integration():
             
             # Test extraction command
             print("\n📤 Testing extraction command...")
-            extract_command = {
-                "id": "test-extract-1", 
-                "method": "extract",
-                "session_id": "test-session",
-                "selector": "h1",
-                "extract_type": "text"
-            }
-            
-            await websocket.send(json.dumps(extract_command))
-            response = await websocket.recv()
-            extract_result = json.loads(response)
+            extract_result = results.get(extract_command["id"], {})
             
             if extract_result.get("success"):
                 print(f"✅ Extraction successful: '{extract_result.get('data')}'")
@@ -97,17 +143,7 @@ async def test_websocket_integration():
             
             # Test wait command
             print("\n⏳ Testing wait command...")
-            wait_command = {
-                "id": "test-wait-1",
-                "method": "wait", 
-                "session_id": "test-session",
-                "condition": "load",
-                "timeout": 5000
-            }
-            
-            await websocket.send(json.dumps(wait_command))
-            response = await websocket.recv()
-            wait_result = json.loads(response)
+            wait_result = results.get(wait_command["id"], {})
             
             if wait_result.get("success"):
                 print(f"✅ Wait successful: {wait_result.get('final_state')}")
@@ -128,53 +164,35 @@ async def test_websocket_integration():
         print(f"\n❌ Integration test failed: {e}")
         logger.exception("Integration test failed")
         return False
-        
-    finally:
-        # Clean up
-        print("\n🧹 Stopping server...")
-        await server.stop()
-        print("✅ Server stopped")
 
 
 async def test_error_scenarios():
     """Test error handling in WebSocket integration."""
     print("\n🛡️ Testing Error Scenarios")
     
-    server = WebSocketServer(host="localhost", port=8082)
-    
-    try:
-        await server.start()
-        await asyncio.sleep(1)
+    async with websockets.connect(TEST_SERVER_URL, **CLIENT_CONNECT_OPTIONS) as websocket:
+        # Test invalid command
+        print("\n❌ Testing invalid command...")
+        invalid_command = {
+            "id": "invalid-1",
+            "method": "nonexistent_command", 
+            "session_id": "test"
+        }
         
-        async with websockets.connect("ws://localhost:8082") as websocket:
-            # Test invalid command
-            print("\n❌ Testing invalid command...")
-            invalid_command = {
-                "id": "invalid-1",
-                "method": "nonexistent_command", 
-                "session_id": "test"
-            }
-            
-            await websocket.send(json.dumps(invalid_command))
-            response = await websocket.recv()
-            result = json.loads(response)
-            
-            if not result.get("success"):
-                print(f"✅ Correctly handled invalid command: {result.get('error_code')}")
-            
-            # Test malformed JSON
-            print("\n❌ Testing malformed JSON...")
-            await websocket.send("{ invalid json }")
-            response = await websocket.recv()
-            result = json.loads(response)
-            
-            if not result.get("success"):
-                print(f"✅ Correctly handled malformed JSON: {result.get('error_code')}")
+        # Pipeline it with the malformed JSON frame below
+        invalid_result, malformed_result = await _pipeline(
+            websocket, [_dumps(invalid_command), "{ invalid json }"]
+        )
         
-        print("\n✅ Error scenario tests completed!")
+        if not invalid_result.get("success"):
+            print(f"✅ Correctly handled invalid command: {invalid_result.get('error_code')}")
         
-    finally:
-        await server.stop()
+        # Test malformed JSON
+        print("\n❌ Testing malformed JSON...")
+        if not malformed_result.get("success"):
+            print(f"✅ Correctly handled malformed JSON: {malformed_result.get('error_code')}")
+    
+    print("\n✅ Error scenario tests completed!")
 
 
 async def main():
@@ -183,9 +201,27 @@ async def main():
     print("🔍 AUX Protocol WebSocket Integration Test Suite")
     print("=" * 70)
     
+    # Create browser manager with test settings
+    browser_manager = BrowserManager(headless=True, timeout_ms=10000)
+    
+    # One server and browser serve both test coroutines
+    server = WebSocketServer(
+        host=TEST_HOST,
+        port=TEST_PORT,
+        browser_manager=browser_manager
+    )
+    
     try:
+        # Start the server
+        print("\n🌐 Starting WebSocket server...")
+        await server.start()
+        print("✅ WebSocket server started")
+        
+        # Wait until the server accepts connections
+        await _wait_ready(TEST_HOST, TEST_PORT)
+        
         # Run integration tests
-        success = await test_websocket_integration()
+        success = await test_websocket_integration(browser_manager)
         
         if success:
             # Run error scenario tests
@@ -203,8 +239,14 @@ async def main():
         print(f"\n💥 Unexpected error: {e}")
         logger.exception("Unexpected error in tests")
         return 1
+        
+    finally:
+        # Clean up
+        print("\n🧹 Stopping server...")
+        await server.stop()
+        print("✅ Server stopped")
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = fast_loop.run(main())
     sys.exit(exit_code)
\ No newline at end of file
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, AsyncGenerator, Generator
 from unittest.mock import Mock, AsyncMock
 import pytest
+import pytest_asyncio
 import yaml
 from faker import Faker
 
@@ -89,15 +90,20 @@ def api_key() -> str:
     return f"test-key-{uuid.uuid4().hex}"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def security_manager(test_config: Config) -> SecurityManager:
     """Provide a configured SecurityManager for testing."""
     return SecurityManager(test_config.security_config)
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def browser_manager(test_config: Config) -> AsyncGenerator[BrowserManager, None]:
-    """Provide a configured BrowserManager for testing."""
+    """
+    Provide a configured BrowserManager, launched once per test module.
+    
+    Runs on the module event loop; tests using it need
+    ``@pytest.mark.asyncio(loop_scope="module")``.
+    """
     manager = BrowserManager(test_config)
     await manager.start()
     try:
@@ -118,12 +124,17 @@ async def mock_browser_session():
     return session
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def websocket_server(
     test_config: Config, 
     security_manager: SecurityManager
 ) -> AsyncGenerator[AUXWebSocketServer, None]:
-    """Provide a running WebSocket server for integration tests."""
+    """
+    Provide a running WebSocket server, started once per test module.
+    
+    Runs on the module event loop; tests using it need
+    ``@pytest.mark.asyncio(loop_scope="module")``.
+    """
     server = AUXWebSocketServer(
         config=test_config,
         security_manager=security_manager
@@ -161,7 +172,7 @@ def test_harness(test_config: Config) -> TestHarness:
     return TestHarness(config=test_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html() -> str:
     """Provide sample HTML content for testing."""
     return """
@@ -192,7 +203,7 @@ def sample_html() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_commands() -> Dict[str, Any]:
     """Provide sample command data for testing."""
     return {
@@ -224,7 +235,7 @@ def sample_commands() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malicious_inputs() -> Dict[str, list]:
     """Provide malicious input samples for security testing."""
     return {
@@ -258,7 +269,7 @@ def malicious_inputs() -> Dict[str, list]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def performance_scenarios() -> Dict[str, Any]:
     """Provide performance testing scenarios."""
     return {
@@ -285,7 +296,7 @@ def performance_scenarios() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_websites() -> Dict[str, str]:
     """Provide test website URLs for E2E testing."""
     return {
@@ -304,7 +315,7 @@ def cleanup_sessions():
     # Cleanup logic here if needed
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def benchmark_config():
     """Configuration for benchmark tests."""
     return {
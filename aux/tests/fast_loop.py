@@ -0,0 +1,33 @@
+"""
+Event loop selection for the standalone test entry points.
+
+The validation scripts prefer a libuv-based event loop (uvloop, or winloop
+on Windows) when one is installed and fall back to the default asyncio
+loop otherwise.
+"""
+
+import asyncio
+import sys
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the fastest available event loop.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return asyncio.run(main)
+    return loop_impl.run(main)
@@ -0,0 +1,101 @@
+"""
+Local HTTP server for browser test pages.
+
+This module serves HTML test pages from an in-process HTTP server bound to
+the loopback interface, so browser tests can navigate real URLs without
+depending on external websites.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from .test_pages import get_basic_test_page
+
+
+class LocalPageServer:
+    """
+    Threaded HTTP server serving a fixed set of HTML pages.
+
+    Binds to an ephemeral port on 127.0.0.1 and can be used as a context
+    manager or started and stopped explicitly.
+    """
+
+    def __init__(
+        self,
+        pages: Optional[Dict[str, str]] = None,
+        delays: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize the page server.
+
+        Args:
+            pages: Mapping of URL path to HTML content (defaults to the
+                basic test page served at "/")
+            delays: Mapping of URL path to seconds to wait before responding
+        """
+        self.pages = pages if pages is not None else {"/": get_basic_test_page()}
+        self.delays = delays or {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("Page server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str = "/") -> str:
+        """Get the absolute URL for a served path."""
+        return f"{self.base_url}{path}"
+
+    def start(self) -> "LocalPageServer":
+        """Start serving pages in a background thread."""
+        # Encode each page once; every request then writes cached bytes
+        bodies = {path: content.encode("utf-8") for path, content in self.pages.items()}
+        delays = self.delays
+
+        class PageHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                body = bodies.get(path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                delay = delays.get(path)
+                if delay:
+                    time.sleep(delay)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep test output quiet
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release its socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "LocalPageServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
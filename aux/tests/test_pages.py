@@ -417,6 +417,22 @@ def get_dynamic_content_page() -> str:
 """
 
 
+def get_customer_form_page() -> str:
+    """Get minimal HTML page with a single named form field."""
+    return """
+<!DOCTYPE html>
+<html lang="en">
+<head><title>Customer Form Page</title></head>
+<body>
+    <form method="post">
+        <label>Customer name: <input name="custname"></label>
+        <button type="submit">Submit</button>
+    </form>
+</body>
+</html>
+"""
+
+
 def get_test_page_data() -> Dict[str, Any]:
     """Get test page data for creating data URLs."""
     return {